@@ -1,15 +1,21 @@
 # -*- coding: utf-8 -*-
+from . import cli
 from . import models
 
 
 def _post_init_hook(env):
     """
     Post-installation hook to set HRMS Dashboard as the default 
-    home action for ALL existing users after module installation.
+    home action for the active internal users after module installation,
+    and to build the presence snapshots and counter summaries of the
+    existing employees.
     """
-    dashboard_action = env.ref('hrms_dashboard.dashboard_action_spa', raise_if_not_found=False)
-    if dashboard_action:
-        # Set dashboard as default for ALL internal users (override any existing action)
-        users = env['res.users'].search([('share', '=', False)])
-        if users:
-            users.write({'action_id': dashboard_action.id})
+    # Set dashboard as default for active internal users (override any existing action)
+    env['res.users']._assign_dashboard_home_action()
+    env['hr.employee.presence']._cron_rebuild()
+    env['hr.employee.dashboard.counter']._cron_rebuild()
+
+
+def _uninstall_hook(env):
+    """Drop the dashboard indexes created on the core module tables."""
+    env['hrms.dashboard.index']._drop_indexes()
@@ -28,16 +28,22 @@
     },
     'data': [
         'security/ir.model.access.csv',
+        'security/hrms_dashboard_security.xml',
+        'data/ir_cron_data.xml',
         'views/dashboard_views.xml',
         'views/res_users_views.xml',
     ],
     'assets': {
         'web.assets_backend': [
-            # Dashboard files
+            # Client action that lazy-loads the dashboard bundle
+            'hrms_dashboard/static/src/js/dashboard_cache.js',
+            'hrms_dashboard/static/src/js/dashboard_loader.js',
+        ],
+        'hrms_dashboard.assets_dashboard': [
+            # Dashboard files, Chart.js comes from web.chartjs_lib on first render
             'hrms_dashboard/static/src/css/dashboard.css',
             'hrms_dashboard/static/src/js/dashboard.js',
             'hrms_dashboard/static/src/xml/dashboard.xml',
-            'https://cdnjs.cloudflare.com/ajax/libs/Chart.js/2.9.4/Chart.js',
         ],
     },
     'images': ['static/description/banner.jpg'],
@@ -46,4 +52,5 @@
     'auto_install': False,
     'sequence': -100,
     'post_init_hook': '_post_init_hook',
+    'uninstall_hook': '_uninstall_hook',
 }
\ No newline at end of file
@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+from . import dashboard_explain
+from . import dashboard_loadtest
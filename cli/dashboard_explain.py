@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import optparse
+import sys
+from pathlib import Path
+
+import odoo
+from odoo.cli import Command
+
+
+class DashboardExplain(Command):
+    """Run EXPLAIN on the HRMS dashboard queries of a database"""
+    name = 'hrms_dashboard_explain'
+
+    def run(self, args):
+        parser = odoo.tools.config.parser
+        parser.prog = f'{Path(sys.argv[0]).name} {self.name}'
+        group = optparse.OptionGroup(parser, "HRMS Dashboard Explain")
+        group.add_option("--login", dest="login", default="admin",
+                         help="Login of the user whose dashboard queries are explained")
+        group.add_option("--analyze", dest="analyze", action="store_true", default=False,
+                         help="Execute the queries (EXPLAIN ANALYZE) to report actual timings")
+        parser.add_option_group(group)
+        opt = odoo.tools.config.parse_config(args, setup_logging=True)
+
+        dbname = odoo.tools.config['db_name']
+        if not dbname:
+            sys.exit("Database name must be provided with -d/--database")
+
+        registry = odoo.modules.registry.Registry(dbname)
+        with registry.cursor() as cr:
+            env = odoo.api.Environment(cr, odoo.SUPERUSER_ID, {})
+            if 'hrms.dashboard.index' not in env:
+                sys.exit("Module hrms_dashboard is not installed on %s" % dbname)
+            user = env['res.users'].search([('login', '=', opt.login)], limit=1)
+            if not user:
+                sys.exit("No user with login %s" % opt.login)
+            report = env['hrms.dashboard.index']._explain_dashboard_queries(user, analyze=opt.analyze)
+            cr.rollback()
+
+        print("%-20s %-20s %12s %10s %10s  %s" % (
+            'query', 'model', 'cost', 'rows', 'time (ms)', 'sequential scans'))
+        for line in report:
+            actual_time = '%.2f' % line['actual_time'] if line['actual_time'] is not None else '-'
+            print("%-20s %-20s %12.2f %10d %10s  %s" % (
+                line['name'], line['model'], line['total_cost'], line['plan_rows'],
+                actual_time, ', '.join(line['seq_scans']) or '-'))
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+import http.cookiejar
+import itertools
+import json
+import optparse
+import random
+import sys
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import odoo
+from odoo.cli import Command
+from odoo.tools import split_every
+
+# Calls fired when a user opens the dashboard, then checks in, as the web
+# client makes them: (model, method, positional args). The employee, projects
+# and upcoming payloads all come from get_dashboard_sections. Record methods
+# get an empty id list, which attendance_manual resolves to the user's employee.
+MORNING_SCENARIO = [
+    ('hr.employee', 'get_dashboard_activity_types', []),
+    ('hr.employee', 'employee_activities_trend', []),
+    ('hr.employee', 'check_user_group', []),
+    ('hr.employee', 'get_dashboard_sections', []),
+    ('ir.ui.menu', 'get_zoho_apps', []),
+    ('hr.employee', 'attendance_manual', [[]]),
+]
+
+LOADTEST_LOGIN = 'hrms_loadtest_%d'
+
+
+class DashboardLoadTest(Command):
+    """Simulate the morning dashboard login and check-in storm against a running server"""
+    name = 'hrms_dashboard_loadtest'
+
+    def run(self, args):
+        parser = odoo.tools.config.parser
+        parser.prog = f'{Path(sys.argv[0]).name} {self.name}'
+        group = optparse.OptionGroup(parser, "HRMS Dashboard Load Test")
+        group.add_option("--url", dest="url", default="http://localhost:8069",
+                         help="Base URL of the Odoo server under test")
+        group.add_option("--users", dest="users", type="int", default=50,
+                         help="Number of concurrent simulated users")
+        group.add_option("--iterations", dest="iterations", type="int", default=1,
+                         help="Dashboard opens per simulated user")
+        group.add_option("--ramp-up", dest="ramp_up", type="float", default=10.0,
+                         help="Seconds over which the simulated users log in")
+        group.add_option("--think-min", dest="think_min", type="float", default=0.5,
+                         help="Minimum think time between calls, in seconds")
+        group.add_option("--think-max", dest="think_max", type="float", default=2.0,
+                         help="Maximum think time between calls, in seconds")
+        group.add_option("--password", dest="password", default="loadtest",
+                         help="Password of the hrms_loadtest_N users")
+        group.add_option("--setup-users", dest="setup_users", action="store_true", default=False,
+                         help="Create the missing load test users and their employees before running")
+        parser.add_option_group(group)
+        opt = odoo.tools.config.parse_config(args, setup_logging=True)
+
+        dbname = odoo.tools.config['db_name']
+        if not dbname:
+            sys.exit("Database name must be provided with -d/--database")
+        if opt.setup_users:
+            self._setup_users(dbname, opt.users, opt.password)
+
+        stats = LoadTestStats()
+        monitor = LockWaitMonitor(dbname, stats)
+        monitor.start()
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=opt.users) as executor:
+            for index in range(opt.users):
+                executor.submit(self._simulate_user, opt, dbname, index, stats)
+        elapsed = time.monotonic() - started
+        monitor.stop()
+        stats.report(elapsed)
+
+    def _setup_users(self, dbname, count, password):
+        """Create internal users with an employee for every simulated user"""
+        registry = odoo.modules.registry.Registry(dbname)
+        with registry.cursor() as cr:
+            env = odoo.api.Environment(cr, odoo.SUPERUSER_ID, {'no_reset_password': True})
+            logins = [LOADTEST_LOGIN % index for index in range(count)]
+            existing = set(env['res.users'].with_context(active_test=False).search(
+                [('login', 'in', logins)]).mapped('login'))
+            missing = [login for login in logins if login not in existing]
+            for batch in split_every(500, missing):
+                users = env['res.users'].create([{
+                    'name': login,
+                    'login': login,
+                    'password': password,
+                    'groups_id': [(6, 0, [env.ref('base.group_user').id])],
+                } for login in batch])
+                env['hr.employee'].create([{'name': user.name, 'user_id': user.id} for user in users])
+                cr.commit()
+            print("Load test users ready: %d created, %d existing" % (len(missing), len(existing)))
+
+    def _simulate_user(self, opt, dbname, index, stats):
+        time.sleep(random.uniform(0, opt.ramp_up))
+        client = JsonRpcClient(opt.url)
+        started = time.monotonic()
+        try:
+            client.call('/web/session/authenticate', {
+                'db': dbname,
+                'login': LOADTEST_LOGIN % index,
+                'password': opt.password,
+            })
+            stats.record('session/authenticate', time.monotonic() - started)
+        except Exception as e:
+            stats.record('session/authenticate', time.monotonic() - started, error=e)
+            return
+
+        for _iteration in range(opt.iterations):
+            for model, method, method_args in MORNING_SCENARIO:
+                endpoint = '%s.%s' % (model, method)
+                stats.enter(endpoint)
+                started = time.monotonic()
+                try:
+                    client.call('/web/dataset/call_kw/%s/%s' % (model, method), {
+                        'model': model,
+                        'method': method,
+                        'args': method_args,
+                        'kwargs': {},
+                    })
+                    stats.record(endpoint, time.monotonic() - started)
+                except Exception as e:
+                    stats.record(endpoint, time.monotonic() - started, error=e)
+                finally:
+                    stats.leave(endpoint)
+                time.sleep(random.uniform(opt.think_min, opt.think_max))
+
+
+class JsonRpcClient:
+    """Minimal JSON-RPC client keeping its own session cookie"""
+
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+        self.request_id = itertools.count()
+
+    def call(self, path, params):
+        payload = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'id': next(self.request_id),
+            'params': params,
+        }).encode()
+        request = urllib.request.Request(
+            self.url + path, data=payload, headers={'Content-Type': 'application/json'})
+        with self.opener.open(request, timeout=120) as response:
+            body = json.load(response)
+        if body.get('error'):
+            raise RuntimeError(body['error'].get('data', {}).get('name') or body['error'].get('message'))
+        return body.get('result')
+
+
+class LoadTestStats:
+    """Thread-safe latency, error and lock wait accounting per endpoint"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(lambda: defaultdict(int))
+        self.in_flight = defaultdict(int)
+        self.lock_wait_samples = defaultdict(int)
+        self.lock_wait_queries = defaultdict(int)
+
+    def enter(self, endpoint):
+        with self.lock:
+            self.in_flight[endpoint] += 1
+
+    def leave(self, endpoint):
+        with self.lock:
+            self.in_flight[endpoint] -= 1
+
+    def record(self, endpoint, duration, error=None):
+        with self.lock:
+            self.latencies[endpoint].append(duration)
+            if error is not None:
+                self.errors[endpoint][str(error)[:80]] += 1
+
+    def record_lock_waits(self, waits):
+        """
+        Count a sample of lock-waiting backends. Backends cannot be tied to the
+        request that opened them, so each endpoint in flight at sample time
+        gets one sample; the waiting queries and the relations they wait on
+        are tallied separately.
+        """
+        with self.lock:
+            for endpoint, count in self.in_flight.items():
+                if count:
+                    self.lock_wait_samples[endpoint] += 1
+            for relation, query in waits:
+                self.lock_wait_queries['[%s] %s' % (relation, query)] += 1
+
+    def report(self, elapsed):
+        def percentile(values, pct):
+            return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+        print("\nDuration: %.1fs" % elapsed)
+        print("%-45s %7s %8s %8s %8s %8s %8s %7s %17s" % (
+            'endpoint', 'calls', 'req/s', 'p50 ms', 'p90 ms', 'p95 ms', 'p99 ms', 'errors', 'in-flight w/ lock'))
+        for endpoint in sorted(self.latencies):
+            values = sorted(self.latencies[endpoint])
+            errors = sum(self.errors[endpoint].values())
+            print("%-45s %7d %8.1f %8.0f %8.0f %8.0f %8.0f %6.1f%% %17d" % (
+                endpoint, len(values), len(values) / elapsed if elapsed else 0,
+                percentile(values, 50) * 1000, percentile(values, 90) * 1000,
+                percentile(values, 95) * 1000, percentile(values, 99) * 1000,
+                100.0 * errors / len(values), self.lock_wait_samples.get(endpoint, 0)))
+
+        for endpoint, errors in sorted(self.errors.items()):
+            for message, count in sorted(errors.items(), key=lambda item: -item[1]):
+                print("  error %s: %dx %s" % (endpoint, count, message))
+        if self.lock_wait_queries:
+            print("\n'in-flight w/ lock': lock-wait samples taken while the endpoint was in flight")
+            print("Queries seen waiting on locks, by relation:")
+            for query, count in sorted(self.lock_wait_queries.items(), key=lambda item: -item[1])[:10]:
+                print("  %5dx %s" % (count, query))
+
+
+class LockWaitMonitor(threading.Thread):
+    """Sample pg_stat_activity for backends of the database waiting on a lock"""
+
+    def __init__(self, dbname, stats, interval=0.5):
+        super().__init__(daemon=True)
+        self.dbname = dbname
+        self.stats = stats
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        db = odoo.sql_db.db_connect(self.dbname)
+        with db.cursor() as cr:
+            while not self.stopped.wait(self.interval):
+                cr.execute("""
+                    SELECT DISTINCT ON (a.pid)
+                           COALESCE(l.relation::regclass::text, l.locktype),
+                           left(regexp_replace(a.query, '\\s+', ' ', 'g'), 100)
+                      FROM pg_stat_activity a
+                      JOIN pg_locks l ON l.pid = a.pid AND NOT l.granted
+                     WHERE a.datname = current_database()
+                       AND a.wait_event_type = 'Lock'
+                """)
+                waits = cr.fetchall()
+                if waits:
+                    self.stats.record_lock_waits(waits)
+                cr.rollback()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
@@ -1,4 +1,11 @@
 # -*- coding: utf-8 -*-
+from . import account_analytic_line
+from . import hr_attendance
 from . import hr_employee
+from . import hr_employee_dashboard_counter
+from . import hr_employee_presence
+from . import hr_leave
+from . import hrms_dashboard_index
+from . import ir_actions
 from . import ir_ui_menu
 from . import res_users
\ No newline at end of file
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models
+
+
+class AccountAnalyticLine(models.Model):
+    _inherit = 'account.analytic.line'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        self.env['hr.employee.dashboard.counter'].sudo()._refresh_source_counters(
+            self._name, lines.sudo().employee_id)
+        return lines
+
+    def write(self, vals):
+        if not self.env['hr.employee.dashboard.counter']._get_source_trigger_fields(self._name) & set(vals):
+            return super().write(vals)
+        employees = self.sudo().employee_id
+        res = super().write(vals)
+        self.env['hr.employee.dashboard.counter'].sudo()._refresh_source_counters(
+            self._name, employees | self.sudo().employee_id)
+        return res
+
+    def unlink(self):
+        employees = self.sudo().employee_id
+        res = super().unlink()
+        self.env['hr.employee.dashboard.counter'].sudo()._refresh_source_counters(self._name, employees)
+        return res
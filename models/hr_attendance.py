@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models
+
+
+class HrAttendance(models.Model):
+    _inherit = 'hr.attendance'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        attendances = super().create(vals_list)
+        self.env['hr.employee.presence']._refresh_attendance(attendances.employee_id)
+        return attendances
+
+    def write(self, vals):
+        employees = self.employee_id
+        res = super().write(vals)
+        if {'employee_id', 'check_in', 'check_out'} & set(vals):
+            self.env['hr.employee.presence']._refresh_attendance(employees | self.employee_id)
+        return res
+
+    def unlink(self):
+        employees = self.employee_id
+        res = super().unlink()
+        self.env['hr.employee.presence']._refresh_attendance(employees)
+        return res
@@ -1,13 +1,70 @@
 # -*- coding: utf-8 -*-
 from odoo import api, fields, models
-from datetime import date, datetime, timedelta
+from odoo.exceptions import UserError
+from odoo.addons.project.models.project_task import CLOSED_STATES
+from odoo.tools import SQL
+from datetime import date, datetime, time, timedelta
 import calendar
+import hashlib
+import time as time_module
+import pytz
+
+# Record types browsable through get_history_page:
+# (model, field the history is ordered and filtered on, fields read per row)
+HISTORY_RECORD_TYPES = {
+    'attendance': ('hr.attendance', 'check_in', ['check_in', 'check_out', 'worked_hours']),
+    'leave': ('hr.leave', 'date_from', ['date_from', 'request_date_from', 'request_date_to', 'holiday_status_id', 'state']),
+    'expense': ('hr.expense', 'date', ['date', 'name', 'total_amount', 'state']),
+}
+
+# Largest page get_history_page and get_employee_task_feed serve, whatever
+# the client asks for
+HISTORY_PAGE_MAX_LIMIT = 100
+
+# Seconds the company-wide part of the employee section stamp is reused
+COMPANY_STAMP_TTL = 60
+
+# Company-wide stamps per database: (expiry, stamp)
+_company_stamp_cache = {}
+
+# Task feed order, tasks without deadline last
+TASK_FEED_ORDER = 'date_deadline asc, id asc'
+
+LEAVE_STATE_COLORS = {
+    'draft': '#6c757d',
+    'confirm': '#ffc107',
+    'validate1': '#17a2b8',
+    'validate': '#28a745',
+    'refuse': '#dc3545',
+}
+
+EXPENSE_STATE_COLORS = {
+    'draft': '#6c757d',
+    'reported': '#ffc107',
+    'approved': '#17a2b8',
+    'done': '#28a745',
+    'refused': '#dc3545',
+}
 
 
 class HrEmployee(models.Model):
     _inherit = 'hr.employee'
 
-    def attendance_manual(self, next_action=None):
+    @api.model_create_multi
+    def create(self, vals_list):
+        employees = super().create(vals_list)
+        self.env['hr.employee.presence']._refresh_attendance(employees)
+        self.env['hr.employee.dashboard.counter'].sudo()._refresh_counters(employees)
+        return employees
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'user_id' in vals:
+            # Some counter sources are keyed by the employee's user
+            self.env['hr.employee.dashboard.counter'].sudo()._refresh_counters(self)
+        return res
+
+    def attendance_manual(self, next_action=None, expected_state=None):
         """
         Manual attendance check-in/check-out method for dashboard
         This method handles toggling between checked_in and checked_out states
@@ -16,6 +73,9 @@ class HrEmployee(models.Model):
         Can be called in two ways:
         1.As instance method: employee.attendance_manual()
         2.As model method with IDs: self.env['hr.employee'].attendance_manual([employee_id])
+
+        expected_state is the attendance state the caller saw; the call is
+        refused when the employee checked in or out elsewhere meanwhile.
         """
         # Handle both calling conventions
         if self: 
@@ -27,6 +87,11 @@ class HrEmployee(models.Model):
         
         if not employee:
             return False
+
+        if expected_state and employee.attendance_state != expected_state:
+            if employee.attendance_state == 'checked_in':
+                raise UserError(self.env._("You are already checked in."))
+            raise UserError(self.env._("You are already checked out."))
         
         # Perform the attendance action
         if employee.attendance_state == 'checked_out': 
@@ -49,6 +114,13 @@ class HrEmployee(models.Model):
         
         return employee
 
+    def _get_employee_image_url(self, employee, field_name):
+        """URL of the employee photo, False when there is none"""
+        if not employee.with_context(bin_size=True)[field_name]:
+            return False
+        return '/web/image/hr.employee.public/%d/%s?unique=%s' % (
+            employee.id, field_name, int(employee.write_date.timestamp()) if employee.write_date else '')
+
     def _get_leave_balance_summary(self, employee):
         """Get leave balance summary for dashboard card"""
         try:
@@ -96,8 +168,8 @@ class HrEmployee(models.Model):
                 'id': False,
                 'user_id': self.env.user.id,
                 'name': 'User',
-                'image_1920': False,
-                'image_128': False,
+                'image_1920_url': False,
+                'image_128_url': False,
                 'job_id': False,
                 'department_id': False,
                 'company_id': False,
@@ -108,6 +180,8 @@ class HrEmployee(models.Model):
                 'experience': '-',
                 'payslip_count': 0,
                 'timesheet_count': 0,
+                'timesheet_planned_hours': 0,
+                'timesheet_actual_hours': 0,
                 'documents_count': 0,
                 'announcements_count': 0,
                 'contracts_count': 0,
@@ -124,25 +198,23 @@ class HrEmployee(models.Model):
             }]
 
         try:
-            # Get attendance lines
-            attendance_lines = self._get_attendance_lines(employee)
-            
-            # Get leave lines
-            leave_lines = self._get_leave_lines(employee)
-            
-            # Get expense lines
-            expense_lines = self._get_expense_lines(employee)
+            # Get the first page of attendance, leave and expense history
+            attendance_page = self._get_history_lines_page('attendance', employee)
+            leave_page = self._get_history_lines_page('leave', employee)
+            expense_page = self._get_history_lines_page('expense', employee)
 
             # Calculate experience
             experience = self._calculate_experience(employee)
             # Get leave balance summary
             leave_summary = self._get_leave_balance_summary(employee)
-            # Get various counts - UPDATED to use correct models
-            payslip_count = self._get_payslip_count(employee)
-            timesheet_count = self._get_timesheet_report_count(employee)  # NEW: from timesheet.report
-            documents_count = self._get_documents_count(employee)  # NEW: from hr.employee.document
+            # Header card counts, read from the materialized counter summary
+            counters = self.env['hr.employee.dashboard.counter'].sudo()._get_counters(employee)
+            payslip_count = counters['payslip_count']
+            timesheet_count = counters['timesheet_line_count']  # task.timesheet.line
+            documents_count = counters['documents_count']  # hr.employee.document
+            contracts_count = counters['contracts_count']
             announcements_count = self._get_announcements_count()  # NEW: from hr.announcement
-            emp_timesheets = self._get_timesheet_count(employee)  # Keep for backward compatibility
+            emp_timesheets = counters['timesheet_count']  # Keep for backward compatibility
             
             # Manager specific counts
             leaves_to_approve = self._get_leaves_to_approve()
@@ -155,8 +227,9 @@ class HrEmployee(models.Model):
                 'id': employee.id,
                 'user_id': self.env.user.id,
                 'name': employee.name or 'User',
-                'image_1920': employee.image_1920 or False,
-                'image_128': employee.image_128 or False,
+                # URLs rather than base64 data, the payload is cached client-side
+                'image_1920_url': self._get_employee_image_url(employee, 'image_1920'),
+                'image_128_url': self._get_employee_image_url(employee, 'image_128'),
                 'job_id': [employee.job_id.id, employee.job_id.name] if employee.job_id else False,
                 'department_id': [employee.department_id.id, employee.department_id.name] if employee.department_id else False,
                 'company_id': [employee.company_id.id, employee.company_id.name] if employee.company_id else False,
@@ -166,9 +239,12 @@ class HrEmployee(models.Model):
                 'attendance_state': employee.attendance_state or 'checked_out',
                 'experience': experience,
                 'payslip_count': payslip_count,
-                'timesheet_count': timesheet_count,  # NEW: timesheet.report count
+                'timesheet_count': timesheet_count,  # NEW: task.timesheet.line count
+                'timesheet_planned_hours': counters['timesheet_planned_hours'],
+                'timesheet_actual_hours': counters['timesheet_actual_hours'],
                 'documents_count': documents_count,  # NEW: hr.employee.document count
                 'announcements_count': announcements_count,  # NEW: hr.announcement count
+                'contracts_count': contracts_count,
                 'emp_timesheets': emp_timesheets,
                 'broad_factor': 0,
                 'leaves_to_approve': leaves_to_approve,
@@ -176,10 +252,15 @@ class HrEmployee(models.Model):
                 'leaves_this_month': leaves_this_month,
                 'leaves_alloc_req': leaves_alloc_req,
                 'job_applications': job_applications,
-                'attendance_lines': attendance_lines,
-                'leave_lines': leave_lines,
+                'attendance_lines': attendance_page['lines'],
+                'leave_lines': leave_page['lines'],
                 'leave_balance_summary': leave_summary,
-                'expense_lines': expense_lines,
+                'expense_lines': expense_page['lines'],
+                'history_cursors': {
+                    'attendance': attendance_page['next_cursor'],
+                    'leave': leave_page['next_cursor'],
+                    'expense': expense_page['next_cursor'],
+                },
             }]
             # Debug log for dashboard counts
             _logger = getattr(self, '_logger', None)
@@ -192,87 +273,261 @@ class HrEmployee(models.Model):
         except Exception as e:
             return [{'name': 'User', 'error': str(e)}]
 
-    def _get_attendance_lines(self, employee):
-        """Get recent attendance records"""
-        try: 
-            attendances = self.env['hr.attendance'].sudo().search([
-                ('employee_id', '=', employee.id)
-            ], order='check_in desc', limit=10)
-            
-            lines = []
-            for att in attendances:
-                check_in = fields.Datetime.context_timestamp(self, att.check_in)
-                check_out = fields.Datetime.context_timestamp(self, att.check_out) if att.check_out else False
-                
-                lines.append({
-                    'id': att.id,
-                    'date': check_in.strftime('%Y-%m-%d'),
-                    'sign_in': check_in.strftime('%H:%M'),
-                    'sign_out': check_out.strftime('%H:%M') if check_out else '-',
-                    'worked_hours': '{:.2f}'.format(att.worked_hours) if att.worked_hours else '0.00',
-                })
-            return lines
-        except Exception: 
-            return []
+    @api.model
+    def get_dashboard_sections(self, versions=None):
+        """
+        Return the version stamp of every dashboard section, plus the payload
+        of the sections whose stamp differs from the client's cached one.
+        """
+        versions = versions or {}
+        self.env.flush_all()
+        sections = {
+            'employee': (self._get_employee_section_version, self._get_employee_section),
+            'projects': (self._get_projects_section_version, self._get_projects_section),
+            'upcoming': (self._get_upcoming_section_version, self.get_upcoming),
+            'charts': (self._get_charts_section_version, self._get_charts_section),
+        }
+        result = {'versions': {}, 'sections': {}}
+        for name, (get_version, get_payload) in sections.items():
+            version = get_version()
+            if version and versions.get(name) == version:
+                result['versions'][name] = version
+                continue
+            payload = get_payload()
+            if name == 'employee' and payload and payload[0].get('error'):
+                # Never let the client cache a failed payload
+                version = False
+            result['versions'][name] = version
+            result['sections'][name] = payload
+        return result
 
-    def _get_leave_lines(self, employee):
-        """Get recent leave records"""
-        try: 
-            leaves = self.env['hr.leave'].sudo().search([
-                ('employee_id', '=', employee.id)
-            ], order='date_from desc', limit=10)
-            
-            state_colors = {
-                'draft': '#6c757d',
-                'confirm': '#ffc107',
-                'validate1': '#17a2b8',
-                'validate': '#28a745',
-                'refuse': '#dc3545',
-            }
-            
-            lines = []
-            for leave in leaves: 
-                lines.append({
-                    'id': leave.id,
-                    'request_date_from': leave.request_date_from.strftime('%Y-%m-%d') if leave.request_date_from else '',
-                    'request_date_to': leave.request_date_to.strftime('%Y-%m-%d') if leave.request_date_to else '',
-                    'type': leave.holiday_status_id.name if leave.holiday_status_id else '',
-                    'state': dict(leave._fields['state'].selection).get(leave.state, leave.state),
-                    'color': state_colors.get(leave.state, '#6c757d'),
-                })
-            return lines
+    def _get_model_stamp(self, model_name, domain):
+        """Return a cheap [count, last write date] stamp of the matching records"""
+        if model_name not in self.env:
+            return None
+        try:
+            [(count, write_date)] = self.env[model_name].sudo()._read_group(
+                domain, aggregates=['__count', 'write_date:max'])
+            return [count, str(write_date or '')]
         except Exception:
-            return []
+            return None
 
-    def _get_expense_lines(self, employee):
-        """Get recent expense records"""
-        try: 
-            Expense = self.env['hr.expense']
-            expenses = Expense.sudo().search([
-                ('employee_id', '=', employee.id)
-            ], order='date desc', limit=10)
-            
-            state_colors = {
-                'draft': '#6c757d',
-                'reported': '#ffc107',
-                'approved': '#17a2b8',
-                'done': '#28a745',
-                'refused': '#dc3545',
-            }
-            
-            lines = []
-            for exp in expenses:
-                lines.append({
-                    'id': exp.id,
-                    'date': exp.date.strftime('%Y-%m-%d') if exp.date else '',
-                    'name': exp.name or '',
-                    'total_amount': '{:.2f}'.format(exp.total_amount) if exp.total_amount else '0.00',
-                    'state': dict(exp._fields['state'].selection).get(exp.state, exp.state) if hasattr(exp._fields.get('state', {}), 'selection') else str(exp.state),
-                    'color': state_colors.get(exp.state, '#6c757d'),
-                })
-            return lines
-        except Exception: 
-            return []
+    def _make_section_version(self, *parts):
+        """Hash the parts a section depends on into a short version stamp"""
+        return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+    def _get_employee_section_version(self):
+        employee = self.env.user.employee_id
+        if not employee:
+            return self._make_section_version(self.env.user.id, False)
+        emp_domain = [('employee_id', '=', employee.id)]
+        return self._make_section_version(
+            'image_urls',
+            date.today().isoformat(),
+            self.env.user.id,
+            employee.id,
+            str(employee.write_date),
+            self._get_model_stamp('hr.attendance', emp_domain),
+            self._get_model_stamp('hr.leave', emp_domain),
+            self._get_model_stamp('hr.leave.allocation', emp_domain),
+            self._get_model_stamp('hr.expense', emp_domain),
+            self._get_model_stamp('hr.employee.dashboard.counter', emp_domain),
+            self._get_company_counters_stamp(),
+        )
+
+    def _get_company_counters_stamp(self):
+        """
+        Stamp of the company-wide header counters, shared by all users of the
+        database for COMPANY_STAMP_TTL seconds. Only the counts are shown, so
+        the counts over the counters' own bounded domains are the stamp.
+        """
+        now = time_module.monotonic()
+        expiry, stamp = _company_stamp_cache.get(self.env.cr.dbname, (0, None))
+        if now < expiry:
+            return stamp
+        stamp = [
+            self._get_count_stamp('hr.leave', self._get_leaves_to_approve_domain()),
+            self._get_count_stamp('hr.leave', self._get_leaves_today_domain()),
+            self._get_count_stamp('hr.leave', self._get_leaves_this_month_domain()),
+            self._get_count_stamp('hr.leave.allocation', self._get_allocation_requests_domain()),
+            self._get_count_stamp('hr.applicant', []),
+            self._get_count_stamp('hr.announcement', self._get_announcements_domain()),
+        ]
+        _company_stamp_cache[self.env.cr.dbname] = (now + COMPANY_STAMP_TTL, stamp)
+        return stamp
+
+    def _get_count_stamp(self, model_name, domain):
+        """Return the number of matching records, None if the model is missing"""
+        if model_name not in self.env:
+            return None
+        try:
+            [(count,)] = self.env[model_name].sudo()._read_group(domain, aggregates=['__count'])
+            return count
+        except Exception:
+            return None
+
+    def _get_employee_section(self):
+        return self.get_user_employee_details()
+
+    def _get_projects_section(self):
+        return self.get_employee_task_feed(limit=10)
+
+    def _get_projects_section_version(self):
+        return self._make_section_version(
+            'task_feed',
+            # the overdue count moves with the date
+            date.today().isoformat(),
+            self.env.user.id,
+            self._get_model_stamp('project.task', [('user_ids', 'in', [self.env.user.id])]),
+        )
+
+    def _get_upcoming_section_version(self):
+        today = date.today()
+        return self._make_section_version(
+            today.isoformat(),
+            self._get_model_stamp('hr.employee', [('birthday', '!=', False)]),
+            self._get_model_stamp('calendar.event', [
+                ('start', '>=', today),
+                ('start', '<=', today + timedelta(days=30)),
+            ]),
+            self._get_model_stamp('hr.announcement', [('state', '=', 'approved')]),
+        )
+
+    def _get_charts_section_version(self):
+        employee = self.env.user.employee_id
+        emp_domain = [('employee_id', '=', employee.id)]
+        is_manager = self.check_user_group()
+        return self._make_section_version(
+            date.today().isoformat(),
+            employee.id,
+            self._get_model_stamp('hr.attendance', emp_domain) if employee else None,
+            self._get_model_stamp('hr.leave', emp_domain) if employee else None,
+            is_manager,
+            self._get_model_stamp('hr.employee', []) if is_manager else None,
+            self._get_model_stamp('hr.department', []) if is_manager else None,
+        )
+
+    def _get_charts_section(self):
+        return {
+            'leave': self.employee_leave_trend(),
+            'attendance': self.employee_attendance_trend(),
+            'dept': self.get_dept_employee() if self.check_user_group() else [],
+        }
+
+    @api.model
+    def get_history_page(self, record_type, cursor=None, limit=20, date_from=None, date_to=None):
+        """
+        Page through the current user's attendance, leave or expense history,
+        newest first.
+
+        :param record_type: ``attendance``, ``leave`` or ``expense``
+        :param cursor: ``next_cursor`` of the previous page
+        :param limit: page size, capped at ``HISTORY_PAGE_MAX_LIMIT``
+        :param date_from: optional first day to include (``YYYY-MM-DD``)
+        :param date_to: optional last day to include (``YYYY-MM-DD``)
+        :return: dict with the page ``lines`` and the ``next_cursor``, False
+            on the last page
+        """
+        employee = self.env.user.employee_id
+        if not employee or record_type not in HISTORY_RECORD_TYPES:
+            return {'lines': [], 'next_cursor': False}
+        limit = max(1, min(int(limit), HISTORY_PAGE_MAX_LIMIT))
+        return self._get_history_lines_page(record_type, employee, cursor, limit, date_from, date_to)
+
+    def _get_history_lines_page(self, record_type, employee, cursor=None, limit=10, date_from=None, date_to=None):
+        """Keyset-paginated page of history lines, see get_history_page"""
+        try:
+            model_name, order_field, field_names = HISTORY_RECORD_TYPES[record_type]
+            Model = self.env[model_name].sudo()
+            field = Model._fields[order_field]
+            tz = self._get_user_timezone()
+
+            domain, order = self._get_history_search(record_type, employee, cursor, date_from, date_to, tz)
+            records = Model.search_fetch(domain, field_names, order=order, limit=limit + 1)
+            next_cursor = False
+            if len(records) > limit:
+                records = records[:limit]
+                last = records[-1]
+                next_cursor = [field.to_string(last[order_field]) if last[order_field] else False, last.id]
+
+            lines = getattr(self, '_prepare_%s_lines' % record_type)(records, tz)
+            return {'lines': lines, 'next_cursor': next_cursor}
+        except Exception:
+            return {'lines': [], 'next_cursor': False}
+
+    def _get_history_search(self, record_type, employee, cursor=None, date_from=None, date_to=None, tz=None):
+        """Return the (domain, order) of a history page, see get_history_page"""
+        model_name, order_field, _field_names = HISTORY_RECORD_TYPES[record_type]
+        field = self.env[model_name]._fields[order_field]
+        tz = tz or self._get_user_timezone()
+
+        domain = [('employee_id', '=', employee.id)]
+        if date_from:
+            domain.append((order_field, '>=', self._get_history_bound(field, date_from, tz)))
+        if date_to:
+            day_after = fields.Date.to_date(date_to) + timedelta(days=1)
+            domain.append((order_field, '<', self._get_history_bound(field, day_after, tz)))
+        if cursor:
+            value, last_id = cursor
+            if value:
+                # Range condition first so the (employee_id, field) index bounds the scan
+                domain += [(order_field, '<=', value), '|', (order_field, '<', value), ('id', '<', last_id)]
+            else:
+                # Empty values sort first in descending order
+                domain += ['|', '&', (order_field, '=', False), ('id', '<', last_id), (order_field, '!=', False)]
+        return domain, '%s desc, id desc' % order_field
+
+    def _get_user_timezone(self):
+        """Timezone used to display history lines, resolved once per page"""
+        try:
+            return pytz.timezone(self.env.context.get('tz') or self.env.user.tz or 'UTC')
+        except pytz.UnknownTimeZoneError:
+            return pytz.utc
+
+    def _get_history_bound(self, field, day, tz):
+        """Convert a local day into a bound comparable with the given field"""
+        day = fields.Date.to_date(day)
+        if field.type != 'datetime':
+            return day
+        local_midnight = tz.localize(datetime.combine(day, time.min))
+        return local_midnight.astimezone(pytz.utc).replace(tzinfo=None)
+
+    def _prepare_attendance_lines(self, attendances, tz):
+        lines = []
+        for att in attendances:
+            check_in = pytz.utc.localize(att.check_in).astimezone(tz)
+            check_out = pytz.utc.localize(att.check_out).astimezone(tz) if att.check_out else False
+            lines.append({
+                'id': att.id,
+                'date': check_in.strftime('%Y-%m-%d'),
+                'sign_in': check_in.strftime('%H:%M'),
+                'sign_out': check_out.strftime('%H:%M') if check_out else '-',
+                'worked_hours': '{:.2f}'.format(att.worked_hours) if att.worked_hours else '0.00',
+            })
+        return lines
+
+    def _prepare_leave_lines(self, leaves, tz):
+        state_labels = dict(leaves._fields['state']._description_selection(self.env))
+        return [{
+            'id': leave.id,
+            'request_date_from': leave.request_date_from.strftime('%Y-%m-%d') if leave.request_date_from else '',
+            'request_date_to': leave.request_date_to.strftime('%Y-%m-%d') if leave.request_date_to else '',
+            'type': leave.holiday_status_id.name if leave.holiday_status_id else '',
+            'state': state_labels.get(leave.state, leave.state),
+            'color': LEAVE_STATE_COLORS.get(leave.state, '#6c757d'),
+        } for leave in leaves]
+
+    def _prepare_expense_lines(self, expenses, tz):
+        state_field = expenses._fields.get('state')
+        state_labels = dict(state_field._description_selection(self.env)) if state_field and state_field.type == 'selection' else {}
+        return [{
+            'id': exp.id,
+            'date': exp.date.strftime('%Y-%m-%d') if exp.date else '',
+            'name': exp.name or '',
+            'total_amount': '{:.2f}'.format(exp.total_amount) if exp.total_amount else '0.00',
+            'state': state_labels.get(exp.state, str(exp.state)),
+            'color': EXPENSE_STATE_COLORS.get(exp.state, '#6c757d'),
+        } for exp in expenses]
 
     def _calculate_experience(self, employee):
         """Calculate employee experience"""
@@ -293,111 +548,69 @@ class HrEmployee(models.Model):
         except Exception:
             return '-'
 
-    def _get_payslip_count(self, employee):
-        """Get payslip count from hr.payslip (hr_payroll_community)"""
-        try:
-            return self.env['hr.payslip'].sudo().search_count([
-                ('employee_id', '=', employee.id)
-            ])
-        except Exception: 
-            return 0
-
-    def _get_timesheet_report_count(self, employee):
-        """Get timesheet count from timesheet.report (task_management Time Log Summary)"""
-        try:
-            # Check if model exists in registry
-            if 'timesheet.report' in self.env: 
-                return self.env['timesheet.report'].sudo().search_count([
-                    ('employee_id', '=', employee.id)
-                ])
-            return 0
-        except Exception as e:
-            print(f"Error getting timesheet count: {e}")
-            return 0
-
-    def _get_documents_count(self, employee):
-        """Get documents count from hr.employee.document, filtered by employee"""
-        try:
-            if 'hr.employee.document' in self.env:
-                return self.env['hr.employee.document'].sudo().search_count([
-                    ('employee_id', '=', employee.id)
-                ])
-            return 0
-        except Exception as e:
-            print(f"Error getting documents count: {e}")
-            return 0
+    def _get_announcements_domain(self):
+        today = date.today().strftime('%Y-%m-%d')
+        return [
+            ('state', '=', 'approved'),
+            ('date_start', '<=', today),
+            '|', ('date_end', '>=', today), ('date_end', '=', False)
+        ]
 
     def _get_announcements_count(self):
         """Get announcements count from hr.announcement (hr_reward_warning), filtered by date and state"""
         try:
             if 'hr.announcement' in self.env:
-                today = date.today().strftime('%Y-%m-%d')
-                return self.env['hr.announcement'].sudo().search_count([
-                    ('state', '=', 'approved'),
-                    ('date_start', '<=', today),
-                    '|', ('date_end', '>=', today), ('date_end', '=', False)
-                ])
+                return self.env['hr.announcement'].sudo().search_count(self._get_announcements_domain())
             return 0
         except Exception as e:
             print(f"Error getting announcements count: {e}")
             return 0
 
-    def _get_contracts_count(self, employee):
-        try:
-            return self.env['hr.contract'].sudo().search_count([
-                ('employee_id', '=', employee.id)
-            ])
-        except Exception:
-            return 0
-
-    def _get_timesheet_count(self, employee):
-        """Legacy method - kept for backward compatibility"""
-        try: 
-            return self.env['account.analytic.line'].sudo().search_count([
-                ('employee_id', '=', employee.id),
-                ('project_id', '!=', False)
-            ])
-        except Exception: 
-            return 0
+    def _get_leaves_to_approve_domain(self):
+        return [('state', 'in', ['confirm', 'validate1'])]
 
     def _get_leaves_to_approve(self):
         try:
-            return self.env['hr.leave'].sudo().search_count([
-                ('state', 'in', ['confirm', 'validate1'])
-            ])
+            return self.env['hr.leave'].sudo().search_count(self._get_leaves_to_approve_domain())
         except Exception: 
             return 0
 
+    def _get_leaves_today_domain(self):
+        today = date.today()
+        return [
+            ('date_from', '<=', today),
+            ('date_to', '>=', today),
+            ('state', '=', 'validate')
+        ]
+
     def _get_leaves_today(self):
         try:
-            today = date.today()
-            return self.env['hr.leave'].sudo().search_count([
-                ('date_from', '<=', today),
-                ('date_to', '>=', today),
-                ('state', '=', 'validate')
-            ])
+            return self.env['hr.leave'].sudo().search_count(self._get_leaves_today_domain())
         except Exception:
             return 0
 
+    def _get_leaves_this_month_domain(self):
+        today = date.today()
+        first_day = today.replace(day=1)
+        last_day = today.replace(day=calendar.monthrange(today.year, today.month)[1])
+        return [
+            ('date_from', '>=', first_day),
+            ('date_to', '<=', last_day),
+            ('state', '=', 'validate')
+        ]
+
     def _get_leaves_this_month(self):
         try:
-            today = date.today()
-            first_day = today.replace(day=1)
-            last_day = today.replace(day=calendar.monthrange(today.year, today.month)[1])
-            
-            return self.env['hr.leave'].sudo().search_count([
-                ('date_from', '>=', first_day),
-                ('date_to', '<=', last_day),
-                ('state', '=', 'validate')
-            ])
+            return self.env['hr.leave'].sudo().search_count(self._get_leaves_this_month_domain())
         except Exception: 
             return 0
 
+    def _get_allocation_requests_domain(self):
+        return [('state', 'in', ['confirm', 'validate1'])]
+
     def _get_allocation_requests(self):
         try:
-            return self.env['hr.leave.allocation'].sudo().search_count([
-                ('state', 'in', ['confirm', 'validate1'])
-            ])
+            return self.env['hr.leave.allocation'].sudo().search_count(self._get_allocation_requests_domain())
         except Exception: 
             return 0
 
@@ -409,23 +622,105 @@ class HrEmployee(models.Model):
 
     @api.model
     def get_employee_project_tasks(self):
-        """Get employee's project tasks"""
-        try: 
-            tasks = self.env['project.task'].sudo().search([
-                '|',
-                ('user_ids', 'in', [self.env.user.id]),
-                ('user_id', '=', self.env.user.id)
-            ], order='date_deadline asc', limit=10)
+        """Get employee's open project tasks, first page of the task feed"""
+        return self.get_employee_task_feed(limit=10)['tasks']
 
-            return [{
+    @api.model
+    def get_employee_task_feed(self, limit=20, cursor=None, closed=False):
+        """
+        Page through the tasks assigned to the current user, ordered by
+        deadline (tasks without deadline last) then id.
+
+        :param limit: page size, capped at ``HISTORY_PAGE_MAX_LIMIT``
+        :param cursor: ``next_cursor`` of the previous page, ``[deadline, id]``
+        :param closed: list done/cancelled tasks instead of open ones
+        :return: dict with the page of ``tasks``, the ``next_cursor`` (False on
+            the last page), per-stage counts, the overdue count and the total
+        """
+        limit = max(1, min(int(limit), HISTORY_PAGE_MAX_LIMIT))
+        result = {'tasks': [], 'next_cursor': False, 'stage_counts': [], 'overdue_count': 0, 'total': 0}
+        try:
+            Task = self.env['project.task'].sudo()
+            base_domain = self._get_task_feed_domain(closed)
+
+            # Stage and overdue counts from a single grouped query
+            self.env.cr.execute(self._get_task_feed_counts_query(base_domain))
+            rows = self.env.cr.fetchall()
+            stages = self.env['project.task.type'].sudo().browse(
+                [stage_id for stage_id, _count, _overdue in rows if stage_id])
+            stage_names = {stage.id: stage.name for stage in stages}
+            result['stage_counts'] = [{
+                'stage_id': stage_id or False,
+                'stage_name': stage_names.get(stage_id, ''),
+                'count': count,
+            } for stage_id, count, _overdue in rows]
+            if not closed:
+                # Done and cancelled tasks are never overdue
+                result['overdue_count'] = sum(overdue for _stage_id, _count, overdue in rows)
+            result['total'] = sum(count for _stage_id, count, _overdue in rows)
+
+            tasks = Task.search_fetch(
+                self._get_task_page_domain(base_domain, cursor),
+                ['name', 'project_id', 'date_deadline', 'stage_id'],
+                order=TASK_FEED_ORDER, limit=limit + 1,
+            )
+            if len(tasks) > limit:
+                tasks = tasks[:limit]
+                last = tasks[-1]
+                result['next_cursor'] = [
+                    fields.Datetime.to_string(last.date_deadline) if last.date_deadline else False,
+                    last.id,
+                ]
+
+            result['tasks'] = [{
                 'id': task.id,
                 'task_name': task.name or '',
                 'project_name': task.project_id.name if task.project_id else '',
                 'date_deadline': task.date_deadline.strftime('%Y-%m-%d') if task.date_deadline else '-',
                 'stage_name': task.stage_id.name if task.stage_id else '',
             } for task in tasks]
+            return result
         except Exception:
-            return []
+            return result
+
+    def _get_task_feed_domain(self, closed=False):
+        """Domain of the current user's open (or closed) tasks"""
+        return [
+            ('user_ids', 'in', [self.env.user.id]),
+            ('state', 'in' if closed else 'not in', list(CLOSED_STATES)),
+        ]
+
+    def _get_task_feed_counts_query(self, domain):
+        """Per-stage total and overdue counts of the tasks matching domain"""
+        Task = self.env['project.task'].sudo()
+        query = Task._search(domain)
+        query.order = None
+        stage_sql = SQL.identifier(Task._table, 'stage_id')
+        query.groupby = stage_sql
+        return query.select(
+            stage_sql,
+            SQL("COUNT(*)"),
+            SQL("COUNT(*) FILTER (WHERE %s < %s)",
+                SQL.identifier(Task._table, 'date_deadline'), fields.Datetime.now()),
+        )
+
+    def _get_task_page_domain(self, domain, cursor=None):
+        """Restrict domain to the tasks after cursor in TASK_FEED_ORDER"""
+        if not cursor:
+            return domain
+        # Keyset pagination on (date_deadline, id), NULL deadlines sort last
+        deadline, last_id = cursor
+        if deadline:
+            return domain + [
+                '|', '|',
+                ('date_deadline', '>', deadline),
+                '&', ('date_deadline', '=', deadline), ('id', '>', last_id),
+                ('date_deadline', '=', False),
+            ]
+        return domain + [('date_deadline', '=', False), ('id', '>', last_id)]
+
+    def _get_upcoming_birthday_domain(self):
+        return [('birthday', '!=', False)]
 
     @api.model
     def get_upcoming(self):
@@ -435,7 +730,7 @@ class HrEmployee(models.Model):
         
         # Birthdays
         try:
-            employees = self.env['hr.employee'].sudo().search([('birthday', '!=', False)])
+            employees = self.env['hr.employee'].sudo().search(self._get_upcoming_birthday_domain())
             birthdays = []
             for emp in employees:
                 bday = emp.birthday
@@ -577,18 +872,20 @@ class HrEmployee(models.Model):
         except Exception: 
             return []
     
+    def _get_activity_domain(self):
+        return [('user_id', '=', self.env.user.id)]
+
     @api.model
     def get_dashboard_activity_types(self):
         """Return activity type cards with counts for the dashboard."""
         Activity = self.env['mail.activity']
-        user_id = self.env.user.id
 
         # Get all activity types
         atypes = self.env['mail.activity.type'].search([])
         
         # Gather count per activity type for user
         per_type = Activity.sudo().read_group(
-            [('user_id', '=', user_id)], 
+            self._get_activity_domain(), 
             ['activity_type_id'], 
             ['activity_type_id']
         )
@@ -596,7 +893,7 @@ class HrEmployee(models.Model):
                     for x in per_type if x['activity_type_id']}
         
         # Total count
-        total_count = Activity.sudo().search_count([('user_id', '=', user_id)])
+        total_count = Activity.sudo().search_count(self._get_activity_domain())
 
         # Type icons mapping
         type_icons = {
@@ -650,6 +947,13 @@ class HrEmployee(models.Model):
 
         return result
     
+    def _get_activity_trend_domain(self, user, first, last):
+        return [
+            ('user_id', '=', user.id),
+            ('date_deadline', '>=', first),
+            ('date_deadline', '<=', last),
+        ]
+
     @api.model
     def employee_activities_trend(self):
         """
@@ -670,11 +974,7 @@ class HrEmployee(models.Model):
                 last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
 
             # Count activities assigned to this user in this month (by date_deadline)
-            count = Activity.search_count([
-                ('user_id', '=', user.id),
-                ('date_deadline', '>=', first),
-                ('date_deadline', '<=', last),
-            ])
+            count = Activity.search_count(self._get_activity_trend_domain(user, first, last))
             result.append({'month': first.strftime('%b'), 'count': count})
 
-        return result
\ No newline at end of file
+        return result
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+from odoo import api, fields, models
+from odoo.tools import split_every
+
+
+# Counter field: (source model, field linking the source records to the
+# employee or to its user, extra domain on the source records, aggregate).
+COUNTER_SOURCES = {
+    'payslip_count': ('hr.payslip', 'employee_id', [], '__count'),
+    'timesheet_line_count': ('task.timesheet.line', 'user_id', [], '__count'),
+    'timesheet_planned_hours': ('task.timesheet.line', 'user_id', [], 'planned_hours:sum'),
+    'timesheet_actual_hours': ('task.timesheet.line', 'user_id', [], 'unit_amount:sum'),
+    'documents_count': ('hr.employee.document', 'employee_ref_id', [], '__count'),
+    'contracts_count': ('hr.contract', 'employee_id', [], '__count'),
+    'timesheet_count': ('account.analytic.line', 'employee_id', [('project_id', '!=', False)], '__count'),
+}
+
+# Source models of optional modules. They cannot be extended through
+# _inherit, so their create/write/unlink are hooked at registry load, the way
+# base_automation hooks models. account.analytic.line is a dependency and
+# extends the counters through a regular _inherit.
+OPTIONAL_COUNTER_MODELS = ['hr.payslip', 'task.timesheet.line', 'hr.employee.document', 'hr.contract']
+
+
+class HrEmployeeDashboardCounter(models.Model):
+    """
+    Denormalized per-employee counters shown on the dashboard header cards,
+    created with the employee, kept current by the source model hooks and
+    rebuilt in bulk every night.
+    """
+    _name = 'hr.employee.dashboard.counter'
+    _description = 'Employee Dashboard Counters'
+
+    employee_id = fields.Many2one('hr.employee', string='Employee', required=True, ondelete='cascade', index=True)
+    payslip_count = fields.Integer()
+    timesheet_line_count = fields.Integer()
+    timesheet_planned_hours = fields.Float()
+    timesheet_actual_hours = fields.Float()
+    documents_count = fields.Integer()
+    contracts_count = fields.Integer()
+    timesheet_count = fields.Integer()
+
+    _sql_constraints = [
+        ('employee_uniq', 'unique(employee_id)', 'An employee can only have one counter summary.'),
+    ]
+
+    def _register_hook(self):
+        super()._register_hook()
+        for model_name in OPTIONAL_COUNTER_MODELS:
+            if model_name in self.env and self._get_source_key_field(model_name) in self.env[model_name]._fields:
+                self._hook_counter_source(self.env.registry[model_name])
+
+    def _unregister_hook(self):
+        """Remove the hooks so a registry reload installs fresh ones"""
+        for model_name in OPTIONAL_COUNTER_MODELS:
+            ModelClass = self.env.registry.get(model_name)
+            for method_name in ('create', 'write', 'unlink'):
+                if ModelClass is not None and getattr(ModelClass.__dict__.get(method_name), '_hrms_counter_hook', False):
+                    delattr(ModelClass, method_name)
+        super()._unregister_hook()
+
+    def _hook_counter_source(self, ModelClass):
+        """Refresh the counters fed by ModelClass on its create/write/unlink"""
+        model_name = ModelClass._name
+
+        def refresh(records, employees):
+            records.env['hr.employee.dashboard.counter'].sudo()._refresh_source_counters(model_name, employees)
+
+        @api.model_create_multi
+        def create(self, vals_list, **kw):
+            records = create.origin(self, vals_list, **kw)
+            refresh(records, records.env['hr.employee.dashboard.counter']._get_source_employees(records))
+            return records
+
+        def write(self, vals, **kw):
+            Counter = self.env['hr.employee.dashboard.counter']
+            if not Counter._get_source_trigger_fields(model_name) & set(vals):
+                return write.origin(self, vals, **kw)
+            employees = Counter._get_source_employees(self)
+            res = write.origin(self, vals, **kw)
+            refresh(self, employees | Counter._get_source_employees(self))
+            return res
+
+        def unlink(self, **kw):
+            employees = self.env['hr.employee.dashboard.counter']._get_source_employees(self)
+            res = unlink.origin(self, **kw)
+            refresh(self.browse(), employees)
+            return res
+
+        for method in (create, write, unlink):
+            method.origin = getattr(ModelClass, method.__name__)
+            method._hrms_counter_hook = True
+            setattr(ModelClass, method.__name__, method)
+
+    @api.model
+    def _get_source_key_field(self, model_name):
+        return next(source[1] for source in COUNTER_SOURCES.values() if source[0] == model_name)
+
+    @api.model
+    def _get_source_trigger_fields(self, model_name):
+        """Source fields whose change can move a record between counters or change its value"""
+        trigger_fields = {'active'}
+        for source_model, key_field, domain, aggregate in COUNTER_SOURCES.values():
+            if source_model == model_name:
+                trigger_fields.add(key_field)
+                trigger_fields.update(leaf[0] for leaf in domain)
+                if aggregate != '__count':
+                    trigger_fields.add(aggregate.split(':')[0])
+        return trigger_fields
+
+    @api.model
+    def _get_source_employees(self, records):
+        """Employees whose counters the given source records feed"""
+        key_field = self._get_source_key_field(records._name)
+        if key_field not in records._fields:
+            return self.env['hr.employee']
+        keys = records.sudo()[key_field]
+        if keys._name == 'res.users':
+            return self.env['hr.employee'].sudo().with_context(active_test=False).search([('user_id', 'in', keys.ids)])
+        return keys
+
+    @api.model
+    def _get_counters(self, employee):
+        """Return the header card counters of an employee, zeros until its row is built"""
+        counter = self.search_fetch([('employee_id', '=', employee.id)], list(COUNTER_SOURCES), limit=1)
+        return {name: counter[name] if counter else 0 for name in COUNTER_SOURCES}
+
+    @api.model
+    def _get_source_counter_fields(self, model_name):
+        return [name for name, source in COUNTER_SOURCES.items() if source[0] == model_name]
+
+    @api.model
+    def _refresh_source_counters(self, model_name, employees):
+        """Recount the counters fed by model_name for the given employees"""
+        self._refresh_counters(employees, self._get_source_counter_fields(model_name))
+
+    @api.model
+    def _refresh_counters(self, employees, counter_fields=None):
+        """Recount the given counters (all by default) of the given employees"""
+        employees = employees.exists()
+        if not employees:
+            return
+        vals_by_employee = {employee_id: {} for employee_id in employees.ids}
+        for name in counter_fields or COUNTER_SOURCES:
+            model_name, key_field, domain, aggregate = COUNTER_SOURCES[name]
+            values = {}
+            if model_name in self.env and key_field in self.env[model_name]._fields:
+                by_user = self.env[model_name]._fields[key_field].comodel_name == 'res.users'
+                keys = employees.user_id if by_user else employees
+                groups = self.env[model_name].sudo()._read_group(
+                    [(key_field, 'in', keys.ids)] + domain, [key_field], [aggregate])
+                totals = {key.id: value or 0 for key, value in groups}
+                for employee in employees:
+                    key = employee.user_id if by_user else employee
+                    values[employee.id] = totals.get(key.id, 0)
+            for employee_id, vals in vals_by_employee.items():
+                vals[name] = values.get(employee_id, 0)
+
+        counters = self.search([('employee_id', 'in', employees.ids)])
+        for counter in counters:
+            vals = vals_by_employee[counter.employee_id.id]
+            if any(counter[name] != value for name, value in vals.items()):
+                counter.write(vals)
+        missing = set(employees.ids) - set(counters.employee_id.ids)
+        if missing:
+            self.create([dict(vals_by_employee[employee_id], employee_id=employee_id) for employee_id in missing])
+
+    @api.model
+    def _cron_rebuild(self, batch_size=1000):
+        """Recount every employee's counters in batches"""
+        employees = self.env['hr.employee'].sudo().with_context(active_test=False).search([])
+        for batch_ids in split_every(batch_size, employees.ids):
+            self._refresh_counters(employees.browse(batch_ids))
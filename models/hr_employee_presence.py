@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+from odoo import api, fields, models
+from odoo.tools import SQL, split_every
+
+
+class HrEmployeePresence(models.Model):
+    """
+    Stored presence snapshot, one row per employee, kept current by the
+    attendance and leave hooks so "who's in" views do not have to go through
+    the computed hr.employee.attendance_state.
+    """
+    _name = 'hr.employee.presence'
+    _description = 'Employee Presence Snapshot'
+    _order = 'name, id'
+
+    employee_id = fields.Many2one('hr.employee', string='Employee', required=True, ondelete='cascade', index=True)
+    name = fields.Char(related='employee_id.name', store=True)
+    job_title = fields.Char(related='employee_id.job_title', store=True)
+    department_id = fields.Many2one(related='employee_id.department_id', store=True, index=True)
+    company_id = fields.Many2one(related='employee_id.company_id', store=True, index=True)
+    active = fields.Boolean(related='employee_id.active', store=True)
+    attendance_state = fields.Selection([
+        ('checked_out', 'Checked out'),
+        ('checked_in', 'Checked in'),
+    ], required=True, default='checked_out')
+    attendance_since = fields.Datetime(string='Since')
+    leave_id = fields.Many2one('hr.leave', string='Current or Next Leave', ondelete='set null', groups='hr.group_hr_user')
+    leave_type_name = fields.Char(groups='hr.group_hr_user')
+    leave_date_from = fields.Datetime()
+    leave_date_to = fields.Datetime()
+
+    _sql_constraints = [
+        ('employee_uniq', 'unique(employee_id)', 'An employee can only have one presence snapshot.'),
+    ]
+
+    @api.model
+    def get_presence(self, department_id=False, limit=5000):
+        """
+        Return the presence of the active employees, optionally restricted
+        to a department, with the checked in and on leave totals. The leave
+        type is only disclosed to HR users.
+        """
+        domain = [('department_id', '=', department_id)] if department_id else []
+        snapshots = self.search_fetch(domain, [
+            'employee_id', 'name', 'job_title', 'department_id', 'attendance_state',
+            'attendance_since', 'leave_date_from', 'leave_date_to',
+        ], limit=limit)
+
+        now = fields.Datetime.now()
+        # on_leave comes from the stored dates; leaves that ended since the
+        # last rebuild are rolled over by a cron rather than by this read
+        if any(snapshot.leave_date_to and snapshot.leave_date_to < now for snapshot in snapshots):
+            cron = self.env.ref('hrms_dashboard.ir_cron_roll_expired_presence_leaves', raise_if_not_found=False)
+            if cron:
+                cron.sudo()._trigger()
+
+        show_leave_type = self.env.user.has_group('hr.group_hr_user')
+        leave_types = {}
+        if show_leave_type:
+            leave_types = {snapshot.id: snapshot.leave_type_name for snapshot in snapshots.sudo()}
+        employees = []
+        for snapshot in snapshots:
+            on_leave = bool(snapshot.leave_date_from and snapshot.leave_date_from <= now <= snapshot.leave_date_to)
+            employees.append({
+                'employee_id': snapshot.employee_id.id,
+                'name': snapshot.name or '',
+                'job_title': snapshot.job_title or '',
+                'department_id': snapshot.department_id.id,
+                'attendance_state': snapshot.attendance_state,
+                'since': fields.Datetime.to_string(snapshot.attendance_since) if snapshot.attendance_since else False,
+                'on_leave': on_leave,
+                'leave_type': leave_types.get(snapshot.id) or '' if on_leave else '',
+            })
+        return {
+            'employees': employees,
+            'checked_in': sum(1 for emp in employees if emp['attendance_state'] == 'checked_in'),
+            'on_leave': sum(1 for emp in employees if emp['on_leave']),
+            'total': len(employees),
+        }
+
+    @api.model
+    def _refresh_attendance(self, employees):
+        """Recompute the attendance part of the snapshot from the latest attendance"""
+        employees = employees.exists()
+        if not employees:
+            return
+        self.env['hr.attendance'].flush_model(['employee_id', 'check_in', 'check_out'])
+        self.env.cr.execute(SQL("""
+            SELECT DISTINCT ON (employee_id) employee_id, check_in, check_out
+              FROM hr_attendance
+             WHERE employee_id IN %s
+          ORDER BY employee_id, check_in DESC
+        """, tuple(employees.ids)))
+        latest = {employee_id: (check_in, check_out) for employee_id, check_in, check_out in self.env.cr.fetchall()}
+
+        vals_by_employee = {}
+        for employee_id in employees.ids:
+            check_in, check_out = latest.get(employee_id, (False, False))
+            if check_in and not check_out:
+                vals_by_employee[employee_id] = {'attendance_state': 'checked_in', 'attendance_since': check_in}
+            else:
+                vals_by_employee[employee_id] = {'attendance_state': 'checked_out', 'attendance_since': check_out or False}
+        self._write_snapshots(vals_by_employee)
+
+    @api.model
+    def _refresh_leave(self, employees):
+        """Point the snapshot to the current or next validated leave of each employee"""
+        employees = employees.exists()
+        if not employees:
+            return
+        leaves = self.env['hr.leave'].sudo().search_fetch([
+            ('employee_id', 'in', employees.ids),
+            ('state', '=', 'validate'),
+            ('date_to', '>=', fields.Datetime.now()),
+        ], ['employee_id', 'holiday_status_id', 'date_from', 'date_to'], order='date_from asc, id asc')
+
+        vals_by_employee = dict.fromkeys(employees.ids, {
+            'leave_id': False,
+            'leave_type_name': False,
+            'leave_date_from': False,
+            'leave_date_to': False,
+        })
+        seen = set()
+        for leave in leaves:
+            if leave.employee_id.id in seen:
+                continue
+            seen.add(leave.employee_id.id)
+            vals_by_employee[leave.employee_id.id] = {
+                'leave_id': leave.id,
+                'leave_type_name': leave.holiday_status_id.name,
+                'leave_date_from': leave.date_from,
+                'leave_date_to': leave.date_to,
+            }
+        self._write_snapshots(vals_by_employee)
+
+    def _write_snapshots(self, vals_by_employee):
+        """Update the snapshots of the given employees, creating missing ones"""
+        snapshots = self.sudo().with_context(active_test=False).search(
+            [('employee_id', 'in', list(vals_by_employee))])
+        for snapshot in snapshots:
+            vals = vals_by_employee[snapshot.employee_id.id]
+            current = snapshot._convert_to_write({name: snapshot[name] for name in vals})
+            if any((current[name] or False) != (value or False) for name, value in vals.items()):
+                snapshot.write(vals)
+        missing = set(vals_by_employee) - set(snapshots.employee_id.ids)
+        if missing:
+            self.sudo().create([
+                dict(vals_by_employee[employee_id], employee_id=employee_id)
+                for employee_id in missing
+            ])
+
+    @api.model
+    def _cron_roll_expired_leaves(self):
+        """Point the snapshots whose leave has ended to the next leave"""
+        snapshots = self.sudo().with_context(active_test=False).search(
+            [('leave_date_to', '<', fields.Datetime.now())])
+        for batch_ids in split_every(1000, snapshots.employee_id.ids):
+            self._refresh_leave(self.env['hr.employee'].browse(batch_ids))
+
+    @api.model
+    def _cron_rebuild(self, batch_size=1000):
+        """Rebuild every snapshot, rolling expired leaves over to the next one"""
+        employees = self.env['hr.employee'].sudo().with_context(active_test=False).search([])
+        for batch_ids in split_every(batch_size, employees.ids):
+            batch = employees.browse(batch_ids)
+            self._refresh_attendance(batch)
+            self._refresh_leave(batch)
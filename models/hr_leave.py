@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models
+
+
+class HrLeave(models.Model):
+    _inherit = 'hr.leave'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        leaves = super().create(vals_list)
+        validated = leaves.filtered(lambda leave: leave.state == 'validate')
+        if validated:
+            self.env['hr.employee.presence']._refresh_leave(validated.employee_id)
+        return leaves
+
+    def write(self, vals):
+        employees = self.employee_id
+        res = super().write(vals)
+        if {'state', 'employee_id', 'date_from', 'date_to', 'holiday_status_id'} & set(vals):
+            self.env['hr.employee.presence']._refresh_leave(employees | self.employee_id)
+        return res
+
+    def unlink(self):
+        employees = self.employee_id
+        res = super().unlink()
+        self.env['hr.employee.presence']._refresh_leave(employees)
+        return res
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+import calendar
+
+from odoo import api, models
+from odoo.tools import SQL, sql
+
+from .hr_employee import HISTORY_RECORD_TYPES, TASK_FEED_ORDER
+
+
+# Composite indexes backing the dashboard hot queries.
+# (table, index name, column expressions)
+DASHBOARD_INDEXES = [
+    ('hr_attendance', 'hrms_dashboard_hr_attendance_employee_check_in_idx',
+     ['employee_id', 'check_in DESC']),
+    ('hr_leave', 'hrms_dashboard_hr_leave_state_dates_idx',
+     ['state', 'date_from', 'date_to']),
+    ('hr_leave', 'hrms_dashboard_hr_leave_employee_date_from_idx',
+     ['employee_id', 'date_from DESC']),
+    ('mail_activity', 'hrms_dashboard_mail_activity_user_deadline_idx',
+     ['user_id', 'date_deadline']),
+    ('hr_expense', 'hrms_dashboard_hr_expense_employee_date_idx',
+     ['employee_id', 'date DESC']),
+    # The assignee side of the task search is served by the
+    # (user_id, task_id) index Odoo keeps on project_task_user_rel.
+    ('project_task', 'hrms_dashboard_project_task_deadline_idx',
+     ['date_deadline', 'id']),
+]
+
+
+class HrmsDashboardIndex(models.AbstractModel):
+    _name = 'hrms.dashboard.index'
+    _description = 'HRMS Dashboard Indexes'
+
+    def init(self):
+        """Create the dashboard indexes on install and upgrade"""
+        for table, indexname, expressions in DASHBOARD_INDEXES:
+            if sql.table_exists(self.env.cr, table):
+                sql.create_index(self.env.cr, indexname, table, expressions)
+
+    @api.model
+    def _drop_indexes(self):
+        """Drop the dashboard indexes, used on uninstall"""
+        for table, indexname, _expressions in DASHBOARD_INDEXES:
+            sql.drop_index(self.env.cr, indexname, table)
+
+    @api.model
+    def _get_dashboard_queries(self, user):
+        """
+        Return the dashboard hot queries for the given user as
+        (name, model, SQL) tuples, built by the same domain helpers the
+        dashboard endpoints use.
+        """
+        Employee = self.env['hr.employee'].with_user(user)
+        employee = Employee.env.user.employee_id
+
+        def search(model_name, domain, order, limit=None):
+            Model = self.env[model_name].sudo()
+            return Model._search(domain, order=order or Model._order, limit=limit).select()
+
+        def count(model_name, domain):
+            query = self.env[model_name].sudo()._search(domain)
+            query.order = None
+            return query.select(SQL("COUNT(*)"))
+
+        queries = []
+        if employee:
+            # First page of each history tab, fetched with one extra row
+            for record_type in HISTORY_RECORD_TYPES:
+                model_name = HISTORY_RECORD_TYPES[record_type][0]
+                domain, order = Employee._get_history_search(record_type, employee)
+                queries.append(('%s_lines' % record_type, model_name, search(model_name, domain, order, 11)))
+        queries += [
+            ('leaves_to_approve', 'hr.leave', count('hr.leave', Employee._get_leaves_to_approve_domain())),
+            ('leaves_today', 'hr.leave', count('hr.leave', Employee._get_leaves_today_domain())),
+            ('leaves_this_month', 'hr.leave', count('hr.leave', Employee._get_leaves_this_month_domain())),
+            ('allocation_requests', 'hr.leave.allocation',
+             count('hr.leave.allocation', Employee._get_allocation_requests_domain())),
+            ('activities', 'mail.activity', count('mail.activity', Employee._get_activity_domain())),
+        ]
+        today = date.today()
+        first_day = today.replace(day=1)
+        last_day = today.replace(day=calendar.monthrange(today.year, today.month)[1])
+        queries.append(('activity_trend', 'mail.activity', count(
+            'mail.activity', Employee._get_activity_trend_domain(Employee.env.user, first_day, last_day))))
+
+        task_domain = Employee._get_task_feed_domain()
+        queries += [
+            ('task_feed', 'project.task', search('project.task', task_domain, TASK_FEED_ORDER, 11)),
+            ('task_feed_counts', 'project.task', Employee._get_task_feed_counts_query(task_domain)),
+            ('upcoming_birthdays', 'hr.employee',
+             search('hr.employee', Employee._get_upcoming_birthday_domain(), None)),
+        ]
+        return queries
+
+    @api.model
+    def _explain_dashboard_queries(self, user=None, analyze=False):
+        """
+        Run EXPLAIN on every dashboard hot query and report the estimated
+        cost, the estimated rows and the tables read by sequential scan.
+        """
+        user = user or self.env.user
+        options = SQL("ANALYZE, FORMAT JSON") if analyze else SQL("FORMAT JSON")
+        report = []
+        for name, model_name, query in self._get_dashboard_queries(user):
+            self.env.cr.execute(SQL("EXPLAIN (%s) %s", options, query))
+            plan = self.env.cr.fetchone()[0][0]['Plan']
+            report.append({
+                'name': name,
+                'model': model_name,
+                'total_cost': plan.get('Total Cost', 0.0),
+                'plan_rows': plan.get('Plan Rows', 0),
+                'actual_time': plan.get('Actual Total Time'),
+                'seq_scans': sorted(self._collect_seq_scans(plan)),
+            })
+        return report
+
+    def _collect_seq_scans(self, plan):
+        """Return the relations read by sequential scan in a JSON plan node"""
+        relations = set()
+        if plan.get('Node Type') == 'Seq Scan':
+            relations.add(plan.get('Relation Name'))
+        for child in plan.get('Plans', []):
+            relations |= self._collect_seq_scans(child)
+        return relations
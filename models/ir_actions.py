@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models, tools
+from odoo.exceptions import UserError
+from odoo.service.model import get_public_method
+
+
+# View types the dashboard can render in its embedded view container
+SUPPORTED_VIEW_TYPES = ['list', 'kanban', 'form', 'calendar', 'pivot', 'graph', 'activity']
+VIEW_TYPE_FALLBACK_ORDER = ['list', 'kanban', 'form', 'calendar', 'graph', 'pivot', 'activity']
+
+ACTION_FIELDS = {
+    'ir.actions.act_window': ['name', 'res_model', 'view_mode', 'views', 'domain', 'context', 'target', 'res_id'],
+    'ir.actions.client': ['name', 'tag', 'params', 'context', 'target', 'res_model'],
+    'ir.actions.act_url': ['name', 'url', 'target'],
+    'ir.actions.server': ['name'],
+    'ir.actions.report': ['name', 'report_name', 'report_type'],
+}
+
+# Modules searched for XML ids given without their module
+DASHBOARD_XML_ID_MODULES = [
+    'task_management', 'oh_appraisal_ext', 'hr_reward_warning',
+    'hr', 'project', 'hr_holidays', 'hr_attendance',
+]
+
+
+class IrActionsActions(models.Model):
+    _inherit = 'ir.actions.actions'
+
+    @api.model
+    def get_dashboard_action(self, menu_id=False, action_id=False, xml_id=False,
+                             res_model=False, method=False, res_ids=None):
+        """
+        Resolve what the dashboard should open in a single round-trip: a menu,
+        an action (by id or xml id), or the action returned by an object
+        method called on res_model records. Window actions come back with
+        their supported views, the selected view type and model access rights.
+        """
+        if method:
+            return self._call_dashboard_object_method(res_model, method, res_ids or [])
+
+        if menu_id:
+            if menu_id not in self.env['ir.ui.menu']._visible_menu_ids():
+                return False
+            action = self.env['ir.ui.menu'].browse(menu_id).action
+            action_id = action.id if action else False
+        elif xml_id:
+            action_id = self._resolve_dashboard_xml_id(xml_id)
+
+        if not action_id:
+            return False
+        action = self._get_dashboard_action_data(action_id)
+        return dict(action) if action else False
+
+    @api.model
+    def get_dashboard_action_id(self, xml_id):
+        """Return the id of the action with the given XML id, see _resolve_dashboard_xml_id"""
+        return self._resolve_dashboard_xml_id(xml_id) or False
+
+    def _resolve_dashboard_xml_id(self, xml_id):
+        """
+        Return the id of the action with the given XML id. Names without a
+        module, or not matching exactly, are looked up the way the dashboard
+        links expect: any module first, then DASHBOARD_XML_ID_MODULES.
+        """
+        module, _dot, name = xml_id.partition('.') if '.' in xml_id else ('', '', xml_id)
+        ModelData = self.env['ir.model.data'].sudo()
+        domain = [('model', 'in', list(ACTION_FIELDS))]
+        if module:
+            domain.append(('module', '=', module))
+        data = ModelData.search(domain + [('name', '=', name)], limit=1) \
+            or ModelData.search(domain + [('name', 'ilike', name)], limit=1)
+        if not data and not module:
+            data = ModelData.search(domain + [
+                ('module', 'in', DASHBOARD_XML_ID_MODULES),
+                ('name', '=', name),
+            ], limit=1)
+        return data.res_id
+
+    @api.model
+    @tools.ormcache('action_id', 'frozenset(self.env.user.groups_id.ids)', 'self.env.lang')
+    def _get_dashboard_action_data(self, action_id):
+        """Resolved action for the current user's group set, see get_dashboard_action"""
+        action = self.sudo().browse(action_id).exists()
+        if not action or action.type not in ACTION_FIELDS:
+            return False
+        # groups_id lives on the concrete action models only
+        record = self.env[action.type].sudo().browse(action_id)
+        if 'groups_id' in record._fields and record.groups_id \
+                and not (record.groups_id & self.env.user.groups_id):
+            return False
+
+        data = record.read(ACTION_FIELDS[action.type])[0]
+        data['type'] = action.type
+        if action.type == 'ir.actions.act_window':
+            data = self._prepare_dashboard_window_action(data)
+        return data
+
+    def _call_dashboard_object_method(self, res_model, method, res_ids):
+        """
+        Call an object method the way /web/dataset/call_kw does, with the
+        same public method checks, and resolve the action it returns.
+        """
+        if not res_model or res_model not in self.env:
+            raise UserError(self.env._("Unknown model %s", res_model))
+
+        Model = self.env[res_model]
+        get_public_method(Model, method)
+        records = Model.browse(res_ids).exists()
+        result = api.call_kw(Model, method, [records.ids], {})
+        if not isinstance(result, dict) or not result.get('type'):
+            return result if isinstance(result, (bool, int, float, str)) else True
+        if result['type'] == 'ir.actions.act_window':
+            return self._prepare_dashboard_window_action(result)
+        return result
+
+    def _prepare_dashboard_window_action(self, action):
+        """
+        Normalize a window action for the embedded view container: keep the
+        supported views only, pick the view type to open and attach the
+        model access rights.
+        """
+        res_model = action.get('res_model')
+        view_modes = [
+            'list' if mode.strip() == 'tree' else mode.strip()
+            for mode in (action.get('view_mode') or 'list').split(',')
+        ]
+        view_modes = [mode for mode in view_modes if mode in SUPPORTED_VIEW_TYPES]
+
+        views = []
+        for view_id, view_type in action.get('views') or []:
+            view_type = 'list' if view_type == 'tree' else view_type
+            if view_type in SUPPORTED_VIEW_TYPES:
+                views.append([view_id, view_type])
+        available_view_types = list(dict.fromkeys(view_type for _view_id, view_type in views))
+
+        if not available_view_types and res_model:
+            groups = self.env['ir.ui.view'].sudo()._read_group(
+                [('model', '=', res_model), ('type', 'in', SUPPORTED_VIEW_TYPES)], ['type'])
+            available_view_types = [view_type for [view_type] in groups]
+        if not available_view_types:
+            available_view_types = ['list', 'form']
+
+        view_type = next((mode for mode in view_modes if mode in available_view_types), None)
+        if not view_type and action.get('res_id') and 'form' in available_view_types:
+            view_type = 'form'
+        if not view_type:
+            view_type = next(
+                (mode for mode in VIEW_TYPE_FALLBACK_ORDER if mode in available_view_types),
+                available_view_types[0])
+
+        access = dict.fromkeys(['read', 'write', 'create', 'unlink'], False)
+        if res_model in self.env:
+            Model = self.env[res_model]
+            access = {operation: Model.has_access(operation) for operation in access}
+
+        return {
+            **action,
+            'views': views,
+            'view_modes': view_modes,
+            'available_view_types': available_view_types,
+            'view_type': view_type,
+            'access': access,
+        }
@@ -94,4 +94,35 @@ class IrUiMenu(models.Model):
                 'children': get_children_recursive(menu_id, 0),
             }
         except Exception:
-            return None
\ No newline at end of file
+            return None
+
+    @api.model
+    def get_dashboard_menu_context(self, action_id=False, res_model=False):
+        """
+        Return the app menu, the menu chain and the app menu tree for the
+        menu opening an action of res_model, or else the given action.
+        """
+        menu = self.browse()
+        if res_model:
+            actions = self.env['ir.actions.act_window'].sudo().search(
+                [('res_model', '=', res_model)], limit=20)
+            if actions:
+                menu = self.search([
+                    ('action', 'in', ['ir.actions.act_window,%d' % action.id for action in actions]),
+                ], limit=1)
+        if not menu and action_id:
+            action = self.env['ir.actions.actions'].sudo().browse(action_id).exists()
+            if action:
+                menu = self.search([('action', '=', '%s,%d' % (action.type, action.id))], limit=1)
+        if not menu:
+            return False
+
+        # parent_path gives the whole chain without walking up one menu at a time
+        chain = self.browse([int(menu_id) for menu_id in menu.parent_path.split('/') if menu_id])
+        app = chain[0]
+        menu_data = self.get_menu_with_all_children(app.id)
+        return {
+            'app': {'id': app.id, 'name': app.name or ''},
+            'chain': [{'id': item.id, 'name': item.name or ''} for item in chain],
+            'children': menu_data['children'] if menu_data else [],
+        }
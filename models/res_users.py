@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 from odoo import api, models, fields, SUPERUSER_ID
+from odoo.tools import SQL
+
+# Users updated per statement when assigning the dashboard home action
+HOME_ACTION_CHUNK_SIZE = 1000
 
 
 class ResUsers(models.Model):
@@ -15,20 +19,62 @@ class ResUsers(models.Model):
         """Allow writing action_id field"""
         return super().SELF_WRITEABLE_FIELDS + ['action_id']
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Give new internal users the dashboard as home action"""
+        users = super().create(vals_list)
+        new_internal_users = users.filtered(lambda u: not u.share and not u.action_id)
+        if new_internal_users:
+            dashboard_action = self.env.ref('hrms_dashboard.dashboard_action_spa', raise_if_not_found=False)
+            if dashboard_action:
+                new_internal_users.with_user(SUPERUSER_ID).write({'action_id': dashboard_action.id})
+        return users
+
     @api.model
     def set_dashboard_as_home_action(self):
         """
         Set HRMS Dashboard as the home action for all internal users.
         This method is called from XML data on module install/upgrade.
         """
-        dashboard_action = self.env.ref('hrms_dashboard.dashboard_action_spa', raise_if_not_found=False)
-        if dashboard_action:
-            # Get all internal (non-portal/public) users
-            internal_users = self.with_user(SUPERUSER_ID).search([
-                ('share', '=', False),
-                ('active', '=', True),
-            ])
-            if internal_users:
-                internal_users.write({'action_id': dashboard_action.id})
+        self._assign_dashboard_home_action()
         return True
 
+    @api.model
+    def _assign_dashboard_home_action(self):
+        """
+        Point the home action of active internal users to the dashboard
+        with chunked SQL updates, touching only the users whose action
+        differs. Returns the number of updated users.
+        """
+        dashboard_action = self.env.ref('hrms_dashboard.dashboard_action_spa', raise_if_not_found=False)
+        if not dashboard_action:
+            return 0
+
+        self.flush_model(['action_id', 'share', 'active'])
+        cr = self.env.cr
+        last_id = 0
+        updated = 0
+        while True:
+            cr.execute(SQL("""
+                SELECT id FROM res_users
+                 WHERE id > %s
+                   AND share IS NOT TRUE
+                   AND active IS TRUE
+                   AND action_id IS DISTINCT FROM %s
+                 ORDER BY id
+                 LIMIT %s
+            """, last_id, dashboard_action.id, HOME_ACTION_CHUNK_SIZE))
+            user_ids = [row[0] for row in cr.fetchall()]
+            if not user_ids:
+                break
+            cr.execute(SQL("""
+                UPDATE res_users
+                   SET action_id = %s, write_uid = %s, write_date = %s
+                 WHERE id IN %s
+            """, dashboard_action.id, self.env.uid, cr.now(), tuple(user_ids)))
+            updated += cr.rowcount
+            last_id = user_ids[-1]
+
+        if updated:
+            self.invalidate_model(['action_id', 'write_uid', 'write_date'])
+        return updated
@@ -4,8 +4,10 @@ import { registry } from "@web/core/registry";
 import { Component, useState, onMounted, onWillStart, onWillUnmount, useRef, xml } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
 import { _t } from "@web/core/l10n/translation";
-import { loadJS, loadBundle } from "@web/core/assets";
+import { loadBundle } from "@web/core/assets";
+import { browser } from "@web/core/browser/browser";
 import { View } from "@web/views/view";
+import { clearDashboardCache, getDashboardCacheKey } from "@hrms_dashboard/js/dashboard_cache";
 
 
 /**
@@ -112,7 +114,10 @@ export class ZohoDashboard extends Component {
             attendance: [],
             leaves: [],
             expenses: [],
+            historyCursors: {},
+            attendanceConfirmed: false,
             projects: [],
+            taskFeed: { stage_counts: [], overdue_count: 0, total: 0, next_cursor: false },
             tasks: [],
             birthdays: [],
             events: [],
@@ -260,7 +265,10 @@ export class ZohoDashboard extends Component {
             attendance: [],
             leaves: [],
             expenses: [],
+            historyCursors: {},
+            attendanceConfirmed: false,
             projects: [],
+            taskFeed: { stage_counts: [], overdue_count: 0, total: 0, next_cursor: false },
             tasks: [],
             birthdays: [],
             events: [],
@@ -341,7 +349,7 @@ export class ZohoDashboard extends Component {
             // { id: "appraisals", label: "Appraisals" },
             { id: "employee_applications", label: "Employee Application" },
             { id: "tasks", label: "Task Management" },
-            // { id: "projects", label: "Projects" },
+            { id: "projects", label: "Projects" },
             { id: "notifications", label: "Notifications" },
         ];
         // Handler to open EAMS Employee Application view
@@ -412,18 +420,19 @@ export class ZohoDashboard extends Component {
 
         // Lifecycle
         onWillStart(async () => {
-            await this.loadChartLibrary();
-            await this.loadInitialData();
-            await this.loadPhase4Data();
-            await this.loadUserMenuData();
-            // After employee/user state is loaded, load the EAMS count
-            await this.loadManagerEmployeeApplicationsCount();
-            // Fallback: if count is still 0, try again after 2 seconds
-            setTimeout(() => {
-                if (!this.state.managerEmployeeApplicationsCount) {
-                    this.loadManagerEmployeeApplicationsCount();
-                }
-            }, 2000);
+            const cache = this.readDashboardCache();
+            if (cache) {
+                // Render the last known sections right away and revalidate in the background
+                this.applyDashboardSections(cache.sections);
+                this.state.loading = false;
+                this.loadDashboard().then(() => {
+                    if (this.state.currentView === "home") {
+                        this.renderCharts();
+                    }
+                });
+                return;
+            }
+            await this.loadDashboard();
         });
 
         onMounted(() => {
@@ -433,9 +442,7 @@ export class ZohoDashboard extends Component {
             this.setupPersistentFrame();
             this.setupStatButtonInterceptor();
             this.setupClickOutsideHandler();
-            if (this.state.chartLoaded) {
-                this.renderCharts();
-            }
+            this.renderCharts();
             console.log("🏠 Dashboard mounted");
         });
 
@@ -450,6 +457,20 @@ export class ZohoDashboard extends Component {
         this.setupRouterInterception();
     }
 
+    async loadDashboard() {
+        await this.loadInitialData();
+        await this.loadPhase4Data();
+        await this.loadUserMenuData();
+        // After employee/user state is loaded, load the EAMS count
+        await this.loadManagerEmployeeApplicationsCount();
+        // Fallback: if count is still 0, try again after 2 seconds
+        setTimeout(() => {
+            if (!this.state.managerEmployeeApplicationsCount) {
+                this.loadManagerEmployeeApplicationsCount();
+            }
+        }, 2000);
+    }
+
     openLeaveBalancePopup() {
         this.state.leaveBalancePopupOpen = true;
     }
@@ -556,12 +577,11 @@ export class ZohoDashboard extends Component {
                         // Prevent full page navigation - load in embedded mode
                         return await self.loadActionById(numericId);
                     }
-                    // If it's an XML ID string, try to resolve it
+                    // If it's an XML ID string, resolve and load it server-side
                     if (typeof actionRequest === "string" && actionRequest.includes('.')) {
-                        const resolvedId = await self.resolveXmlIdToActionId(actionRequest);
-                        if (resolvedId) {
-                            console.log("🔢 Resolved XML ID to action:", actionRequest, "->", resolvedId);
-                            return await self.loadActionById(resolvedId);
+                        if (await self.loadActionReference(actionRequest)) {
+                            console.log("🔢 Loaded XML ID action:", actionRequest);
+                            return;
                         }
                     }
                 } catch (e) {
@@ -1036,14 +1056,8 @@ export class ZohoDashboard extends Component {
                     event.stopPropagation();
                     event.stopImmediatePropagation();
                     
-                    let actionId = self.extractActionId(buttonName);
-                    if (!actionId && buttonName.includes('.')) {
-                        actionId = await self.resolveXmlIdToActionId(buttonName);
-                    }
-                    
-                    if (actionId) {
-                        console.log("🎯 Intercepting dropdown item action:", actionId);
-                        await self.loadActionById(actionId);
+                    if (await self.loadActionReference(buttonName)) {
+                        console.log("🎯 Intercepting dropdown item action:", buttonName);
                         return;
                     } else {
                         // Try to find action by name
@@ -1122,13 +1136,8 @@ export class ZohoDashboard extends Component {
                         event.preventDefault();
                         event.stopPropagation();
                         event.stopImmediatePropagation();
-                        let actionId = self.extractActionId(dataAction);
-                        if (!actionId && dataAction.includes('.')) {
-                            actionId = await self.resolveXmlIdToActionId(dataAction);
-                        }
-                        if (actionId) {
-                            console.log("🎯 Found data-action:", actionId);
-                            await self.loadActionById(actionId);
+                        if (await self.loadActionReference(dataAction)) {
+                            console.log("🎯 Found data-action:", dataAction);
                             return;
                         }
                     }
@@ -1138,13 +1147,8 @@ export class ZohoDashboard extends Component {
                         event.preventDefault();
                         event.stopPropagation();
                         event.stopImmediatePropagation();
-                        let actionId = self.extractActionId(dataName);
-                        if (!actionId && dataName.includes('.')) {
-                            actionId = await self.resolveXmlIdToActionId(dataName);
-                        }
-                        if (actionId) {
-                            console.log("🎯 Found data-name action:", actionId);
-                            await self.loadActionById(actionId);
+                        if (await self.loadActionReference(dataName)) {
+                            console.log("🎯 Found data-name action:", dataName);
                             return;
                         }
                     }
@@ -1162,18 +1166,9 @@ export class ZohoDashboard extends Component {
                     event.stopPropagation();
                     event.stopImmediatePropagation();
                     
-                    // First try to extract numeric ID
-                    let actionId = self.extractActionId(buttonName);
-                    
-                    // If it's an XML ID (contains a dot), resolve it
-                    if (!actionId && buttonName.includes('.')) {
-                        console.log("🔍 Resolving XML ID:", buttonName);
-                        actionId = await self.resolveXmlIdToActionId(buttonName);
-                    }
-                    
-                    if (actionId) {
-                        console.log("🎯 Intercepting stat button action:", actionId);
-                        await self.loadActionById(actionId);
+                    // Numeric ID or XML ID, resolved and loaded in one call
+                    if (await self.loadActionReference(buttonName)) {
+                        console.log("🎯 Intercepting stat button action:", buttonName);
                         return;
                     } else {
                         console.debug("Could not resolve action (trying fallback):", buttonName);
@@ -1217,39 +1212,36 @@ export class ZohoDashboard extends Component {
                     
                     console.log("🔍 Trying to resolve button without type:", buttonName);
                     
-                    // First try as action ID
-                    let actionId = self.extractActionId(buttonName);
-                    
-                    // Try as XML ID
-                    if (!actionId && buttonName.includes('.')) {
-                        actionId = await self.resolveXmlIdToActionId(buttonName);
+                    // First try as action ID or XML ID
+                    if (await self.loadActionReference(buttonName)) {
+                        console.log("🎯 Found action for button:", buttonName);
+                        return;
                     }
+                    let actionId = null;
                     
                     // Try searching for action by name
-                    if (!actionId) {
-                        try {
-                            const action = await self.orm.searchRead(
-                                "ir.actions.act_window",
-                                ["|", "|", 
-                                    ["xml_id", "ilike", buttonName], 
-                                    ["name", "ilike", buttonName],
-                                    ["binding_model_id.model", "=", self.embeddedState.currentResModel]
-                                ],
-                                ["id", "name"],
-                                { limit: 5 }
+                    try {
+                        const action = await self.orm.searchRead(
+                            "ir.actions.act_window",
+                            ["|", "|", 
+                                ["xml_id", "ilike", buttonName], 
+                                ["name", "ilike", buttonName],
+                                ["binding_model_id.model", "=", self.embeddedState.currentResModel]
+                            ],
+                            ["id", "name"],
+                            { limit: 5 }
+                        );
+                        
+                        // Try to find the best matching action
+                        if (action && action.length) {
+                            // Prefer exact name match
+                            const exactMatch = action.find(a => 
+                                a.name && a.name.toLowerCase().includes(buttonName.toLowerCase())
                             );
-                            
-                            // Try to find the best matching action
-                            if (action && action.length) {
-                                // Prefer exact name match
-                                const exactMatch = action.find(a => 
-                                    a.name && a.name.toLowerCase().includes(buttonName.toLowerCase())
-                                );
-                                actionId = exactMatch ? exactMatch.id : action[0].id;
-                            }
-                        } catch (e) {
-                            console.debug("Could not find stat button action:", e);
+                            actionId = exactMatch ? exactMatch.id : action[0].id;
                         }
+                    } catch (e) {
+                        console.debug("Could not find stat button action:", e);
                     }
                     
                     // Try as an object method (Python method call)
@@ -1280,14 +1272,8 @@ export class ZohoDashboard extends Component {
                 event.stopPropagation();
                 event.stopImmediatePropagation();
                 
-                let actionId = self.extractActionId(buttonName);
-                if (!actionId && buttonName.includes('.')) {
-                    actionId = await self.resolveXmlIdToActionId(buttonName);
-                }
-                
-                if (actionId) {
-                    console.log("🎯 Intercepting form button action:", actionId);
-                    await self.loadActionById(actionId);
+                if (await self.loadActionReference(buttonName)) {
+                    console.log("🎯 Intercepting form button action:", buttonName);
                     return;
                 }
             }
@@ -1322,14 +1308,8 @@ export class ZohoDashboard extends Component {
                     event.preventDefault();
                     event.stopPropagation();
                     
-                    let actionId = self.extractActionId(actionIdAttr);
-                    if (!actionId && actionIdAttr.includes('.')) {
-                        actionId = await self.resolveXmlIdToActionId(actionIdAttr);
-                    }
-                    
-                    if (actionId) {
-                        console.log("🎯 Intercepting data-action-id button:", actionId);
-                        await self.loadActionById(actionId);
+                    if (await self.loadActionReference(actionIdAttr)) {
+                        console.log("🎯 Intercepting data-action-id button:", actionIdAttr);
                     }
                     return;
                 }
@@ -1535,11 +1515,17 @@ export class ZohoDashboard extends Component {
             
             if (resModel && resId) {
                 console.log("🔧 Executing object method:", methodName, "on", resModel, resId);
+                // The server calls the method and resolves the returned action in one round-trip
                 const result = await this.orm.call(
-                    resModel,
-                    methodName,
-                    [[resId]],
-                    { context: this.embeddedState.currentContext || {} }
+                    "ir.actions.actions",
+                    "get_dashboard_action",
+                    [],
+                    {
+                        res_model: resModel,
+                        method: methodName,
+                        res_ids: [resId],
+                        context: this.embeddedState.currentContext || {},
+                    }
                 );
                 
                 console.log("📊 Method returned:", result);
@@ -1554,12 +1540,12 @@ export class ZohoDashboard extends Component {
                         return;
                     }
                     
-                    // Handle client actions
+                    // Handle client actions, already resolved server-side
                     if (result.type === 'ir.actions.client') {
-                        if (result.id) {
+                        if (result.tag) {
+                            await this.mountClientAction(result);
+                        } else if (result.id) {
                             await this.loadClientAction(result.id);
-                        } else if (result.tag) {
-                            await this.loadClientActionByTag(result.tag, result);
                         }
                         return;
                     }
@@ -2643,18 +2629,7 @@ export class ZohoDashboard extends Component {
                 throw new Error("Client action not found");
             }
 
-            this.embeddedState.viewTitle = clientAction.name || "Application";
-            this.embeddedState.currentActionId = actionId;
-
-            const actionData = {
-                ...clientAction,
-                context: this.parseContextSafe(clientAction.context) || {},
-            };
-
-            console.log("🚀 Mounting client action in SPA:", clientAction.tag);
-
-            // Mount the client action in our container
-            await this.doMountClientAction(actionData);
+            await this.mountClientAction(clientAction);
 
         } catch (error) {
             console.error("❌ Failed to load client action:", error);
@@ -2667,6 +2642,31 @@ export class ZohoDashboard extends Component {
         }
     }
 
+    /**
+     * Mount an already read client action inside the SPA container.
+     */
+    async mountClientAction(clientAction) {
+        this.embeddedState.loading = true;
+        this.embeddedState.errorMessage = null;
+        this.embeddedState.isClientAction = true;
+        this.embeddedState.clientActionMounted = false;
+        this.embeddedState.isEmbeddedMode = true;
+        this.state.currentView = "embedded";
+
+        this.embeddedState.viewTitle = clientAction.name || "Application";
+        this.embeddedState.currentActionId = clientAction.id;
+
+        const actionData = {
+            ...clientAction,
+            context: this.parseContextSafe(clientAction.context) || {},
+        };
+
+        console.log("🚀 Mounting client action in SPA:", clientAction.tag);
+
+        // Mount the client action in our container
+        await this.doMountClientAction(actionData);
+    }
+
     async loadClientActionByTag(tag, originalAction = null) {
         console.log("🏷️ Loading client action by tag:", tag);
         
@@ -2933,68 +2933,29 @@ export class ZohoDashboard extends Component {
         }
 
         try {
-            // Find menu that references this action
-            const menus = await this.orm.searchRead(
+            // App, menu chain and app menu tree of the menu opening this action, in one call
+            const menuContext = await this.orm.call(
                 "ir.ui.menu",
-                [["action", "=", `ir.actions.act_window,${actionId}`]],
-                ["id", "name", "parent_id"],
-                { limit: 1 }
+                "get_dashboard_menu_context",
+                [],
+                { action_id: actionId }
             );
 
-            if (menus && menus.length > 0) {
-                let currentMenu = menus[0];
-                let menuChain = [currentMenu];
-                
-                // Traverse up to find root menu
-                while (currentMenu.parent_id) {
-                    const parentMenus = await this.orm.searchRead(
-                        "ir.ui.menu",
-                        [["id", "=", currentMenu.parent_id[0]]],
-                        ["id", "name", "parent_id"],
-                        { limit: 1 }
-                    );
-                    
-                    if (parentMenus && parentMenus.length > 0) {
-                        currentMenu = parentMenus[0];
-                        menuChain.unshift(currentMenu);
-                    } else {
-                        break;
-                    }
-                }
-
-                // Root menu is the first in chain (no parent)
-                const rootMenu = menuChain[0];
-                
-                // Get children of root menu
-                const menuData = await this.orm.call(
-                    "ir.ui.menu",
-                    "get_menu_with_all_children",
-                    [rootMenu.id]
-                );
+            if (menuContext) {
+                const [rootMenu, ...subMenus] = menuContext.chain;
 
-                this.embeddedState.currentApp = {
-                    id: rootMenu.id,
-                    name: rootMenu.name
-                };
-                this.embeddedState.currentMenus = menuData?.children || [];
+                this.embeddedState.currentApp = menuContext.app;
+                this.embeddedState.currentMenus = menuContext.children;
                 
                 // Build breadcrumbs from menu chain
                 this.embeddedState.breadcrumbs = [
-                    { id: rootMenu.id, name: rootMenu.name, type: 'app' }
+                    { id: rootMenu.id, name: rootMenu.name, type: 'app' },
+                    ...subMenus.map(menu => ({ id: menu.id, name: menu.name, type: 'menu' })),
                 ];
                 
-                // Add intermediate menus to breadcrumbs
-                for (let i = 1; i < menuChain.length; i++) {
-                    this.embeddedState.breadcrumbs.push({
-                        id: menuChain[i].id,
-                        name: menuChain[i].name,
-                        type: 'menu'
-                    });
-                }
-                
                 // Update title to match the actual menu name
-                if (menuChain.length > 1) {
-                    this.embeddedState.viewTitle = menuChain[menuChain.length - 1].name;
+                if (subMenus.length) {
+                    this.embeddedState.viewTitle = subMenus[subMenus.length - 1].name;
                 }
                 
                 return;
@@ -3261,16 +3222,8 @@ export class ZohoDashboard extends Component {
                     
                     // If this is an action type button, intercept it
                     if (clickParams.type === 'action' && clickParams.name) {
-                        let actionId = self.extractActionId(clickParams.name);
-                        
-                        // If XML ID, resolve it
-                        if (!actionId && clickParams.name.includes('.')) {
-                            actionId = await self.resolveXmlIdToActionId(clickParams.name);
-                        }
-                        
-                        if (actionId) {
-                            console.log("🎯 Intercepted view button action:", actionId);
-                            await self.loadActionById(actionId);
+                        if (await self.loadActionReference(clickParams.name)) {
+                            console.log("🎯 Intercepted view button action:", clickParams.name);
                             return true; // Indicate we handled it
                         }
                     }
@@ -3320,12 +3273,7 @@ export class ZohoDashboard extends Component {
                     const clickParams = params.clickParams || params;
                     
                     if (clickParams.type === 'action' && clickParams.name) {
-                        let actionId = self.extractActionId(clickParams.name);
-                        if (!actionId && clickParams.name.includes('.')) {
-                            actionId = await self.resolveXmlIdToActionId(clickParams.name);
-                        }
-                        if (actionId) {
-                            await self.loadActionById(actionId);
+                        if (await self.loadActionReference(clickParams.name)) {
                             return true;
                         }
                     }
@@ -3524,91 +3472,19 @@ export class ZohoDashboard extends Component {
 
     async loadMenusForModel(resModel) {
         try {
-            // Get all actions for this model (not just the first one)
-            const actions = await this.orm.searchRead(
-                "ir.actions.act_window",
-                [["res_model", "=", resModel]],
-                ["id", "name"],
-                { limit: 20 }
-            );
-
-            // Try to find a menu linked to any of these actions
-            for (const action of actions) {
-                const actionId = action.id;
-                const menus = await this.orm.searchRead(
-                    "ir.ui.menu",
-                    [["action", "=", `ir.actions.act_window,${actionId}`]],
-                    ["id", "name", "parent_id"],
-                    { limit: 1 }
-                );
-
-                if (menus.length > 0) {
-                    let currentMenu = menus[0];
-                    // Traverse up to find root menu
-                    while (currentMenu.parent_id) {
-                        const parentMenus = await this.orm.searchRead(
-                            "ir.ui.menu",
-                            [["id", "=", currentMenu.parent_id[0]]],
-                            ["id", "name", "parent_id"],
-                            { limit: 1 }
-                        );
-                        if (parentMenus.length > 0) {
-                            currentMenu = parentMenus[0];
-                        } else {
-                            break;
-                        }
-                    }
-
-                    const menuData = await this.orm.call(
-                        "ir.ui.menu",
-                        "get_menu_with_all_children",
-                        [currentMenu.id]
-                    );
-
-                    return {
-                        rootMenu: currentMenu,
-                        children: menuData?.children || []
-                    };
-                }
-            }
-
-            // Fallback: Try to find menu by searching for model name in menu action
-            // Some modules use different action references
-            const allMenus = await this.orm.searchRead(
+            // Root menu and menu tree of the first menu opening an action on this model
+            const menuContext = await this.orm.call(
                 "ir.ui.menu",
-                [["action", "ilike", resModel]],
-                ["id", "name", "parent_id", "action"],
-                { limit: 5 }
+                "get_dashboard_menu_context",
+                [],
+                { res_model: resModel }
             );
-
-            if (allMenus.length > 0) {
-                let currentMenu = allMenus[0];
-                while (currentMenu.parent_id) {
-                    const parentMenus = await this.orm.searchRead(
-                        "ir.ui.menu",
-                        [["id", "=", currentMenu.parent_id[0]]],
-                        ["id", "name", "parent_id"],
-                        { limit: 1 }
-                    );
-                    if (parentMenus.length > 0) {
-                        currentMenu = parentMenus[0];
-                    } else {
-                        break;
-                    }
-                }
-
-                const menuData = await this.orm.call(
-                    "ir.ui.menu",
-                    "get_menu_with_all_children",
-                    [currentMenu.id]
-                );
-
+            if (menuContext) {
                 return {
-                    rootMenu: currentMenu,
-                    children: menuData?.children || []
+                    rootMenu: menuContext.app,
+                    children: menuContext.children,
                 };
             }
-
             return { rootMenu: null, children: [] };
         } catch (error) {
             console.error("Failed to load menus for model:", error);
@@ -3797,7 +3673,7 @@ export class ZohoDashboard extends Component {
             }
 
             if (actionId) {
-                await this.loadActionById(actionId);
+                await this.loadActionByMenuId(actionMenu ? actionMenu.id : app.id);
                 // After loading action, check if resModel matches a sidebar item
                 this.updateSidebarFromResModel();
             } else {
@@ -3822,9 +3698,7 @@ export class ZohoDashboard extends Component {
                 // Handle task management module
                 if (appName.includes('task') && !appName.includes('project')) {
                     // Try to find task management action
-                    const taskAction = await this.resolveXmlIdToActionId('task_management.action_all_tasks');
-                    if (taskAction) {
-                        await this.loadActionById(taskAction);
+                    if (await this.loadActionReference('task_management.action_all_tasks')) {
                         return;
                     }
                 }
@@ -3883,14 +3757,53 @@ export class ZohoDashboard extends Component {
     }
 
     async loadActionById(actionId) {
-        try {
-            const numericId = this.extractActionId(actionId);
-            
-            if (!numericId) {
-                throw new Error("Invalid action ID");
-            }
+        const numericId = this.extractActionId(actionId);
+        if (!numericId) {
+            this.embeddedState.errorMessage = "Invalid action ID";
+            this.embeddedState.loading = false;
+            return false;
+        }
+        const found = await this.loadDashboardAction({ action_id: numericId });
+        if (!found && !this.embeddedState.errorMessage) {
+            this.embeddedState.errorMessage = "Action not found";
+        }
+        return found;
+    }
 
-            console.log("🎬 Loading action by ID:", numericId);
+    /**
+     * Open the action of a menu, resolved server-side from the menu id.
+     */
+    async loadActionByMenuId(menuId) {
+        const found = await this.loadDashboardAction({ menu_id: menuId });
+        if (!found && !this.embeddedState.errorMessage) {
+            this.embeddedState.errorMessage = _t("Failed to load menu");
+        }
+        return found;
+    }
+
+    /**
+     * Open an action given as a numeric id or an XML id. Returns false,
+     * without reporting an error, when no such action exists so callers
+     * can fall back to something else.
+     */
+    async loadActionReference(reference) {
+        const numericId = this.extractActionId(reference);
+        if (numericId) {
+            return this.loadDashboardAction({ action_id: numericId });
+        }
+        if (typeof reference === "string" && reference.includes(".")) {
+            return this.loadDashboardAction({ xml_id: reference });
+        }
+        return false;
+    }
+
+    /**
+     * Resolve an action server-side (by action_id, xml_id or menu_id) and
+     * open it in the embedded container. Returns whether an action was found.
+     */
+    async loadDashboardAction(request) {
+        try {
+            console.log("🎬 Loading action:", request);
 
             // CRITICAL: Ensure embedded mode is active
             if (!this.embeddedState.isEmbeddedMode) {
@@ -3898,6 +3811,19 @@ export class ZohoDashboard extends Component {
                 this.state.currentView = "embedded";
             }
 
+            // Set loading state
+            this.embeddedState.loading = true;
+            this.embeddedState.errorMessage = null;
+
+            // Resolve the action with its supported views and access rights in one round-trip
+            const action = await this.orm.call("ir.actions.actions", "get_dashboard_action", [], request);
+
+            if (!action) {
+                this.embeddedState.loading = false;
+                return false;
+            }
+            const numericId = action.id;
+
             // Save current state to stack before loading new action
             if ((this.embeddedState.currentResModel || this.embeddedState.isClientAction) && 
                 this.embeddedState.currentActionId !== numericId) {
@@ -3915,245 +3841,85 @@ export class ZohoDashboard extends Component {
                 });
             }
 
-            // Set loading state
-            this.embeddedState.loading = true;
-            this.embeddedState.errorMessage = null;
             this.embeddedState.clientActionComponent = null;
             this.embeddedState.clientActionProps = null;
 
-            // First, determine the action type
-            const [actionInfo] = await this.orm.searchRead(
-                "ir.actions.actions",
-                [["id", "=", numericId]],
-                ["type"],
-                { limit: 1 }
-            );
-
-            if (!actionInfo) {
-                throw new Error("Action not found");
-            }
-
-            const actionType = actionInfo.type;
+            const actionType = action.type;
             console.log("📌 Action type:", actionType);
 
             if (actionType === "ir.actions.act_window") {
-                const actionData = await this.orm.call(
-                    "ir.actions.act_window",
-                    "read",
-                    [[numericId]],
-                    { fields: ["res_model", "view_mode", "domain", "context", "name", "views", "target", "res_id"] }
-                );
-
-                if (actionData && actionData.length) {
-                    const action = actionData[0];
-                    
-                    console.log("📋 Raw action data:", {
-                        view_mode: action.view_mode,
-                        views: action.views,
-                        res_model: action.res_model
-                    });
-                    
-                    // Check if it should open as dialog
-                    if (action.target === "new") {
-                        // Pop the saved state since we're not actually navigating
-                        if (this.actionStack.length > 0) {
-                            this.actionStack.pop();
-                        }
-                        this.embeddedState.loading = false;
-                        return this._originalDoAction({
-                            type: "ir.actions.act_window",
-                            ...action
-                        }, { target: "new" });
-                    }
-
-                    // LAYER 1: Define what we support and what we don't
-                    const supportedViewTypes = ["list", "kanban", "form", "calendar", "pivot", "graph", "activity"];
-                    const bannedViewTypes = ["hierarchy", "qweb", "search"];
-                    
-                    // LAYER 2: Clean view_mode string - remove banned types immediately
-                    let viewModeString = action.view_mode || "list";
-                    bannedViewTypes.forEach(banned => {
-                        const regex = new RegExp(`\\b${banned}\\b,?`, 'gi');
-                        viewModeString = viewModeString.replace(regex, '');
-                    });
-                    // Clean up extra commas
-                    viewModeString = viewModeString.replace(/,+/g, ',').replace(/^,|,$/g, '').trim();
-                    if (!viewModeString) viewModeString = "list";
-                    
-                    console.log("🧹 Cleaned view_mode:", viewModeString);
-                    
-                    // Parse cleaned view modes
-                    let viewModes = viewModeString.split(",").map(v => v.trim()).filter(v => v);
-                    
-                    // LAYER 3: Normalize tree to list and filter
-                    viewModes = viewModes
-                        .map(v => v === "tree" ? "list" : v)
-                        .filter(v => supportedViewTypes.includes(v) && !bannedViewTypes.includes(v));
-                    
-                    // LAYER 4: Clean action.views array - remove banned view types
-                    let actionViews = [];
-                    if (Array.isArray(action.views)) {
-                        actionViews = action.views.filter(v => {
-                            const viewType = v[1] === "tree" ? "list" : v[1];
-                            return supportedViewTypes.includes(viewType) && !bannedViewTypes.includes(viewType);
-                        });
-                    }
-                    
-                    // Extract available view types from cleaned action.views
-                    let availableViewTypes = actionViews
-                        .map(v => v[1] === "tree" ? "list" : v[1])
-                        .filter(v => supportedViewTypes.includes(v));
-                    
-                    console.log("✅ Filtered views:", {
-                        viewModes,
-                        actionViews: actionViews.map(v => v[1]),
-                        availableViewTypes
-                    });
-                    
-                    // LAYER 5: If no available views, fetch from database
-                    if (availableViewTypes.length === 0) {
-                        console.log("📋 No valid views in action, fetching from database...");
-                        try {
-                            const dbViews = await this.orm.searchRead(
-                                "ir.ui.view",
-                                [
-                                    ["model", "=", action.res_model],
-                                    ["type", "in", supportedViewTypes],
-                                    ["type", "not in", bannedViewTypes]
-                                ],
-                                ["type"],
-                                { limit: 50 }
-                            );
-                            
-                            availableViewTypes = [...new Set(dbViews.map(v => 
-                                v.type === "tree" ? "list" : v.type
-                            ))].filter(v => supportedViewTypes.includes(v) && !bannedViewTypes.includes(v));
-                            
-                            console.log("✅ Found views in database:", availableViewTypes);
-                        } catch (e) {
-                            console.warn("Could not fetch views from database:", e);
-                        }
-                    }
-                    
-                    // LAYER 6: If still no views, use safe defaults
-                    if (availableViewTypes.length === 0) {
-                        console.log("⚠️ No views found, using safe defaults");
-                        availableViewTypes = ["list", "form"];
-                    }
-                    
-                    // LAYER 7: Select the best view type with multiple fallbacks
-                    let viewType = null;
-                    
-                    // Try 1: First view mode that's available
-                    for (const mode of viewModes) {
-                        if (availableViewTypes.includes(mode) && !bannedViewTypes.includes(mode)) {
-                            viewType = mode;
-                            console.log("✅ Selected from viewModes:", viewType);
-                            break;
-                        }
-                    }
-                    
-                    // Try 2: If res_id is specified, prefer form view
-                    if (!viewType && action.res_id && availableViewTypes.includes("form")) {
-                        viewType = "form";
-                        console.log("✅ Selected form view (res_id present)");
-                    }
-                    
-                    // Try 3: Fallback to preferred order
-                    if (!viewType) {
-                        const fallbackOrder = ["list", "kanban", "form", "calendar", "graph", "pivot", "activity"];
-                        for (const fallback of fallbackOrder) {
-                            if (availableViewTypes.includes(fallback) && !bannedViewTypes.includes(fallback)) {
-                                viewType = fallback;
-                                console.log("✅ Selected from fallback order:", viewType);
-                                break;
-                            }
-                        }
-                    }
-                    
-                    // Try 4: First available view
-                    if (!viewType && availableViewTypes.length > 0) {
-                        viewType = availableViewTypes[0];
-                        console.log("✅ Selected first available:", viewType);
-                    }
-                    
-                    // Try 5: Ultimate fallback
-                    if (!viewType || bannedViewTypes.includes(viewType)) {
-                        viewType = "list";
-                        console.log("⚠️ Using ultimate fallback: list");
+                // Check if it should open as dialog
+                if (action.target === "new") {
+                    // Pop the saved state since we're not actually navigating
+                    if (this.actionStack.length > 0) {
+                        this.actionStack.pop();
                     }
+                    this.embeddedState.loading = false;
+                    await this._originalDoAction(action, { target: "new" });
+                    return true;
+                }
 
-                    console.log("🎯 Final view type:", viewType);
-
-                    // LAYER 8: Final safety check
-                    if (bannedViewTypes.includes(viewType)) {
-                        console.error("❌ Banned view type detected:", viewType);
-                        viewType = "list";
-                    }
+                // Views are filtered, normalized and selected server-side
+                const actionViews = action.views;
+                const availableViewTypes = action.available_view_types;
+                const viewType = action.view_type;
+                console.log("🎯 Final view type:", viewType);
 
-                    const domain = this.parseDomainSafe(action.domain);
-                    const context = this.parseContextSafe(action.context);
+                const domain = this.parseDomainSafe(action.domain);
+                const context = this.parseContextSafe(action.context);
 
-                    this.embeddedState.currentResModel = action.res_model;
-                    this.embeddedState.currentViewType = viewType;
-                    this.embeddedState.currentDomain = domain;
-                    this.embeddedState.currentContext = context;
-                    this.embeddedState.currentResId = action.res_id || false;
-                    this.embeddedState.currentActionId = numericId;
-                    this.embeddedState.isClientAction = false;
-                    
-                    // Store cleaned views
-                    this.embeddedState.currentViews = actionViews;
-                    this.embeddedState.availableViewTypes = availableViewTypes;
-
-                    if (action.name) {
-                        this.embeddedState.viewTitle = action.name;
-                        const currentBreadcrumbs = [...this.embeddedState.breadcrumbs];
-                        const lastCrumb = currentBreadcrumbs[currentBreadcrumbs.length - 1];
-                        if (!lastCrumb || lastCrumb.name !== action.name) {
-                            currentBreadcrumbs.push({
-                                name: action.name,
-                                type: 'action',
-                                actionId: numericId,
-                                resModel: action.res_model,
-                                previousViewType: viewType
-                            });
-                            this.embeddedState.breadcrumbs = currentBreadcrumbs;
-                        }
+                this.embeddedState.currentResModel = action.res_model;
+                this.embeddedState.currentViewType = viewType;
+                this.embeddedState.currentDomain = domain;
+                this.embeddedState.currentContext = context;
+                this.embeddedState.currentResId = action.res_id || false;
+                this.embeddedState.currentActionId = numericId;
+                this.embeddedState.isClientAction = false;
+                
+                // Store cleaned views
+                this.embeddedState.currentViews = actionViews;
+                this.embeddedState.availableViewTypes = availableViewTypes;
+
+                if (action.name) {
+                    this.embeddedState.viewTitle = action.name;
+                    const currentBreadcrumbs = [...this.embeddedState.breadcrumbs];
+                    const lastCrumb = currentBreadcrumbs[currentBreadcrumbs.length - 1];
+                    if (!lastCrumb || lastCrumb.name !== action.name) {
+                        currentBreadcrumbs.push({
+                            name: action.name,
+                            type: 'action',
+                            actionId: numericId,
+                            resModel: action.res_model,
+                            previousViewType: viewType
+                        });
+                        this.embeddedState.breadcrumbs = currentBreadcrumbs;
                     }
+                }
 
-                    // Load bundles for the view type
-                    await this.loadViewBundles(action.res_model, viewType);
+                // Load bundles for the view type
+                await this.loadViewBundles(action.res_model, viewType);
 
-                    // For calendar view, use special loading method
-                    if (viewType === "calendar") {
-                        await this.loadCalendarViaAction(action.res_model, action.name || "Calendar", domain, context);
-                    } else {
-                        // Build props - this will also set loading = false
-                        this.buildDynamicViewProps(action.res_model, viewType, domain, context, action.res_id || false);
-                    }
+                // For calendar view, use special loading method
+                if (viewType === "calendar") {
+                    await this.loadCalendarViaAction(action.res_model, action.name || "Calendar", domain, context);
+                } else {
+                    // Build props - this will also set loading = false
+                    this.buildDynamicViewProps(action.res_model, viewType, domain, context, action.res_id || false);
                 }
             } else if (actionType === "ir.actions.client") {
-                await this.loadClientAction(numericId);
+                // The action is already resolved, mount it without reading it again
+                await this.mountClientAction(action);
             } else if (actionType === "ir.actions.act_url") {
-                const [urlAction] = await this.orm.call(
-                    "ir.actions.act_url",
-                    "read",
-                    [[numericId]],
-                    { fields: ["url", "target"] }
-                );
-                if (urlAction) {
-                    if (this.actionStack.length > 0) {
-                        this.actionStack.pop();
-                    }
-                    this.embeddedState.loading = false;
-                    
-                    if (urlAction.target === "self") {
-                        window.location.href = urlAction.url;
-                    } else {
-                        window.open(urlAction.url, "_blank");
-                        this.notification.add(_t("Link opened in new tab"), { type: "info" });
-                    }
+                if (this.actionStack.length > 0) {
+                    this.actionStack.pop();
+                }
+                this.embeddedState.loading = false;
+                
+                if (action.target === "self") {
+                    window.location.href = action.url;
+                } else {
+                    window.open(action.url, "_blank");
+                    this.notification.add(_t("Link opened in new tab"), { type: "info" });
                 }
             } else if (actionType === "ir.actions.server") {
                 await this.executeServerAction(numericId);
@@ -4168,11 +3934,12 @@ export class ZohoDashboard extends Component {
                 this.embeddedState.currentActionId = numericId;
                 this.embeddedState.loading = false;
             }
-
+            return true;
         } catch (error) {
             console.error("Failed to load action:", error);
             this.embeddedState.errorMessage = error.message || "Failed to load action";
             this.embeddedState.loading = false;
+            return false;
         }
     }
 
@@ -4487,68 +4254,11 @@ export class ZohoDashboard extends Component {
         if (!xmlId) return null;
         
         try {
-            // Split into module and name
-            const parts = xmlId.split('.');
-            let module = '';
-            let name = xmlId;
-            
-            if (parts.length >= 2) {
-                module = parts[0];
-                name = parts.slice(1).join('.');
-            }
-            
-            // Search for the external ID
-            let domain = module 
-                ? [["module", "=", module], ["name", "=", name]]
-                : [["name", "=", name]];
-            
-            let result = await this.orm.searchRead(
-                "ir.model.data",
-                domain,
-                ["res_id", "model"],
-                { limit: 1 }
-            );
-            
-            // If not found with exact match, try with ilike
-            if (!result || result.length === 0) {
-                domain = module 
-                    ? [["module", "=", module], ["name", "ilike", name]]
-                    : [["name", "ilike", name]];
-                    
-                result = await this.orm.searchRead(
-                    "ir.model.data",
-                    domain,
-                    ["res_id", "model"],
-                    { limit: 1 }
-                );
-            }
-            
-            // If still not found and no module was specified, try common module prefixes
-            if ((!result || result.length === 0) && !module) {
-                const commonModules = [
-                    'task_management', 'oh_appraisal_ext', 'hr_reward_warning',
-                    'hr', 'project', 'hr_holidays', 'hr_attendance'
-                ];
-                
-                for (const mod of commonModules) {
-                    const modResult = await this.orm.searchRead(
-                        "ir.model.data",
-                        [["module", "=", mod], ["name", "=", name]],
-                        ["res_id", "model"],
-                        { limit: 1 }
-                    );
-                    if (modResult && modResult.length > 0) {
-                        result = modResult;
-                        break;
-                    }
-                }
-            }
-            
-            if (result && result.length > 0) {
-                console.log("✅ Resolved XML ID:", xmlId, "->", result[0].res_id);
-                return result[0].res_id;
+            const actionId = await this.orm.call("ir.actions.actions", "get_dashboard_action_id", [xmlId]);
+            if (actionId) {
+                console.log("✅ Resolved XML ID:", xmlId, "->", actionId);
+                return actionId;
             }
-            
             console.warn("⚠️ XML ID not found:", xmlId);
         } catch (e) {
             console.error("Could not resolve XML ID:", xmlId, e);
@@ -4572,7 +4282,7 @@ export class ZohoDashboard extends Component {
             this.embeddedState.currentResId = false;
 
             if (menu.action_id) {
-                await this.loadActionById(menu.action_id);
+                await this.loadActionByMenuId(menu.id);
             } else if (menu.children?.length) {
                 const firstChild = this.findFirstMenuWithAction(menu.children);
                 if (firstChild) {
@@ -4582,7 +4292,7 @@ export class ZohoDashboard extends Component {
                         type: 'submenu'
                     });
                     this.embeddedState.viewTitle = firstChild.name;
-                    await this.loadActionById(firstChild.action_id);
+                    await this.loadActionByMenuId(firstChild.id);
                 }
             }
 
@@ -4728,23 +4438,22 @@ export class ZohoDashboard extends Component {
         try {
             if (!this.state.employee?.department_id) return;
 
-            const members = await this.orm.searchRead(
-                "hr.employee",
-                [
-                    ["department_id", "=", this.state.employee.department_id[0]],
-                    ["id", "!=", this.state.employee.id],
-                ],
-                ["id", "name", "job_id", "image_128", "attendance_state"],
-                { limit: 8 }
-            );
+            // Presence comes from the stored snapshot, one indexed read for the whole department
+            const presence = await this.orm.call("hr.employee.presence", "get_presence", [], {
+                department_id: this.state.employee.department_id[0],
+            });
 
-            this.state.teamMembers = members.map(m => ({
-                id: m.id,
-                name: m.name,
-                job: m.job_id ? m.job_id[1] : "",
-                image: m.image_128,
-                status: m.attendance_state,
-            }));
+            this.state.teamMembers = presence.employees
+                .filter(m => m.employee_id !== this.state.employee.id)
+                .map(m => ({
+                    id: m.employee_id,
+                    name: m.name,
+                    job: m.job_title,
+                    image: `/web/image/hr.employee.public/${m.employee_id}/avatar_128`,
+                    status: m.on_leave ? "on_leave" : m.attendance_state,
+                    since: m.since,
+                    leaveType: m.leave_type,
+                }));
         } catch (error) {
             this.state.teamMembers = [];
         }
@@ -4820,40 +4529,26 @@ export class ZohoDashboard extends Component {
 
     // ==================== DATA LOADING ====================
 
-    async loadChartLibrary() {
-        try {
-            // First, try to load Odoo's bundled Chart.js
-            try {
-                await loadBundle('web.chartjs_lib');
-                console.log("✓ Loaded web.chartjs_lib bundle");
-            } catch (e) {
-                // Bundle might not exist, continue
-            }
-            
-            // Check if Chart is now available
-            if (typeof Chart === "undefined" && typeof window.Chart === "undefined") {
-                // Load from CDN as fallback
-                await loadJS("https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js");
-                console.log("✓ Loaded Chart.js from CDN");
-            }
-            
-            // Ensure Chart is globally available
-            if (typeof Chart !== "undefined") {
-                window.Chart = Chart;
-            } else if (typeof window.Chart !== "undefined") {
-                // Already available
-            } else {
-                console.warn("Chart.js could not be loaded");
-                this.state.chartLoaded = false;
-                return;
-            }
-            
-            this.state.chartLoaded = true;
-            console.log("✓ Chart.js ready globally");
-        } catch (error) {
-            console.error("Failed to load Chart.js:", error);
-            this.state.chartLoaded = false;
+    /**
+     * Chart.js is loaded on first chart render from Odoo's locally served
+     * web.chartjs_lib bundle; the promise is shared so it is fetched once.
+     */
+    loadChartLibrary() {
+        if (!this._chartLibraryPromise) {
+            this._chartLibraryPromise = loadBundle("web.chartjs_lib")
+                .then(() => {
+                    this.state.chartLoaded = typeof window.Chart !== "undefined";
+                    if (!this.state.chartLoaded) {
+                        console.warn("Chart.js could not be loaded");
+                    }
+                })
+                .catch((error) => {
+                    console.error("Failed to load Chart.js:", error);
+                    this.state.chartLoaded = false;
+                    this._chartLibraryPromise = null;
+                });
         }
+        return this._chartLibraryPromise;
     }
 
     async loadInitialData() {
@@ -4906,51 +4601,11 @@ export class ZohoDashboard extends Component {
                 this.state.isManager = false;
             }
 
-            // 2. Get employee details
-            let employeeId = false;
+            // 2. Get employee details, along with the other versioned sections
+            let sections = {};
             try {
-                const empDetails = await this.orm.call("hr.employee", "get_user_employee_details", []);
-                console.log("[DASHBOARD] Received employee details from backend:", empDetails);
-                if (empDetails && empDetails[0] && empDetails[0].id) {
-                    // Always ensure employee is an object and preserve card counts if already set
-                    this.state.employee = Object.assign({
-                        payslip_count: 0,
-                        emp_timesheets: 0,
-                        contracts_count: 0,
-                        documents_count: 0,
-                        announcements_count: 0,
-                    }, empDetails[0]);
-                    // Store leave balance summary
-                    if (empDetails[0].leave_balance_summary) {
-                        this.state.leaveBalanceSummary = empDetails[0].leave_balance_summary;
-                    }
-                    console.log("[DASHBOARD] Mapped state.employee:", this.state.employee);
-                    employeeId = empDetails[0].id;
-                    this.state.attendance = empDetails[0].attendance_lines || [];
-                    this.state.leaves = empDetails[0].leave_lines || [];
-                    this.state.expenses = empDetails[0].expense_lines || [];
-                } else {
-                    this.state.employee = {
-                        id: false,
-                        name: 'User',
-                        attendance_state: 'checked_out',
-                        job_id: false,
-                        department_id: false,
-                        work_email: '',
-                        mobile_phone: '',
-                        payslip_count: 0,
-                        emp_timesheets: 0,
-                        contracts_count: 0,
-                        documents_count: 0,
-                        announcements_count: 0,
-                        broad_factor: 0,
-                        leaves_to_approve: 0,
-                        leaves_today: 0,
-                        leaves_this_month: 0,
-                        leaves_alloc_req: 0,
-                        job_applications: 0,
-                    };
-                }
+                sections = await this.revalidateDashboardSections();
+                this.applyDashboardSections({ employee: sections.employee });
             } catch (e) {
                 console.error("Failed to load employee details:", e);
                 this.state.employee = {
@@ -4964,73 +4619,12 @@ export class ZohoDashboard extends Component {
                     announcements_count: 0,
                 };
             }
+            // The attendance state is now the server's, not the cached one
+            this.state.attendanceConfirmed = true;
 
 
-            // 3. Fetch card counts directly from the actual list views' models
-            // Timesheets: Task Management > task.timesheet.line (uses user_id, not employee_id)
-            let timesheetCount = 0;
-            let timesheetPlannedHours = 0;
-            let timesheetActualHours = 0;
-            try {
-                let timesheetDomain = [];
-                if (this.state.employee && this.state.employee.user_id) {
-                    // task.timesheet.line uses user_id field, not employee_id
-                    const userId = Array.isArray(this.state.employee.user_id)
-                        ? this.state.employee.user_id[0]
-                        : this.state.employee.user_id;
-                    if (userId) {
-                        timesheetDomain = [["user_id", "=", userId]];
-                    }
-                }
-                if (timesheetDomain.length > 0) {
-                    timesheetCount = await this.orm.searchCount("task.timesheet.line", timesheetDomain);
-                    // Fetch all time logs for the user and sum planned/actual hours
-                    const timesheetLines = await this.orm.searchRead(
-                        "task.timesheet.line",
-                        timesheetDomain,
-                        ["planned_hours", "unit_amount"],
-                        { limit: 1000 }
-                    );
-                    timesheetPlannedHours = timesheetLines.reduce((sum, l) => sum + (parseFloat(l.planned_hours) || 0), 0);
-                    timesheetActualHours = timesheetLines.reduce((sum, l) => sum + (parseFloat(l.unit_amount) || 0), 0);
-                    console.log("[DASHBOARD] Timesheet count:", timesheetCount, "Planned:", timesheetPlannedHours, "Actual:", timesheetActualHours);
-                } else {
-                    console.warn("[DASHBOARD] No user_id found for employee, skipping timesheet count");
-                }
-            } catch (e) {
-                console.error("[DASHBOARD] Error fetching timesheet count:", e);
-                timesheetCount = 0;
-                timesheetPlannedHours = 0;
-                timesheetActualHours = 0;
-            }
-
-            // Payslips: Payroll > Employee Payslips (hr.payslip)
-            let payslipCount = 0;
-            try {
-                let payslipDomain = [];
-                if (this.state.employee && this.state.employee.id) {
-                    payslipDomain = [["employee_id", "=", this.state.employee.id]];
-                }
-                payslipCount = await this.orm.searchCount("hr.payslip", payslipDomain);
-                console.log("[DASHBOARD] Payslip count:", payslipCount, "domain:", payslipDomain);
-            } catch (e) {
-                console.error("[DASHBOARD] Error fetching payslip count:", e);
-                payslipCount = 0;
-            }
-
-            // Documents: Employees > Documents (hr.employee.document with correct field)
-            let docCount = 0;
-            try {
-                let docDomain = [];
-                if (this.state.employee && this.state.employee.id) {
-                    docDomain = [["employee_ref_id", "=", this.state.employee.id]];
-                }
-                docCount = await this.orm.searchCount("hr.employee.document", docDomain);
-                console.log("[DASHBOARD] Document count from hr.employee.document:", docCount);
-            } catch (e) {
-                console.error("[DASHBOARD] Error fetching document count:", e);
-                docCount = 0;
-            }
+            // 3. Timesheet, payslip and document card counts come with the
+            // employee details, read from the materialized counter summary
 
             // Announcements: Announcements (hr.announcement) - match backend logic for all types
             let annCount = 0;
@@ -5156,23 +4750,18 @@ export class ZohoDashboard extends Component {
             // Update all counts and new quick stats reactively in one go
             this.state.employee = {
                 ...this.state.employee,
-                timesheet_count: timesheetCount,
-                payslip_count: payslipCount,
-                documents_count: docCount,
                 announcements_count: annCount,
                 working_hours: workingHoursDisplay,
                 employee_applications: employeeApplicationsCount,
             };
-            this.state.timesheet_planned_hours = timesheetPlannedHours;
-            this.state.timesheet_actual_hours = timesheetActualHours;
             this.state.task_count = taskCount;
             this.state.working_hours = workingHoursDisplay;
             this.state.attendanceChartData = attendanceChartData;
             this.state.leaveChartData = leaveChartData;
             console.log("[DASHBOARD] Updated employee counts and quick stats:", {
-                timesheet_count: timesheetCount,
-                payslip_count: payslipCount,
-                documents_count: docCount,
+                timesheet_count: this.state.employee.timesheet_count,
+                payslip_count: this.state.employee.payslip_count,
+                documents_count: this.state.employee.documents_count,
                 announcements_count: annCount,
                 task_count: taskCount,
                 working_hours: workingHours,
@@ -5180,26 +4769,12 @@ export class ZohoDashboard extends Component {
                 leaveChartData,
             });
 
-            // Load additional data: projects, upcoming events, charts
-            try {
-                const projects = await this.orm.call("hr.employee", "get_employee_project_tasks", []);
-                this.state.projects = projects || [];
-            } catch (e) {
-                this.state.projects = [];
-            }
-
-            try {
-                const upcoming = await this.orm.call("hr.employee", "get_upcoming", []);
-                if (upcoming) {
-                    this.state.birthdays = upcoming.birthday || [];
-                    this.state.events = upcoming.event || [];
-                    this.state.announcements = upcoming.announcement || [];
-                }
-            } catch (e) {
-                console.error("Failed to load upcoming:", e);
-            }
-
-            await this.loadChartData();
+            // Additional sections: projects, upcoming events, charts
+            this.applyDashboardSections({
+                projects: sections.projects,
+                upcoming: sections.upcoming,
+                charts: sections.charts,
+            });
             await this.loadActivitiesTrendData(); // ADD THIS LINE
 
             if (this.state.isManager && !this.contentTabs.find(t => t.id === 'manager')) {
@@ -5246,11 +4821,8 @@ export class ZohoDashboard extends Component {
 
     async openAllTasks() {
         try {
-            const actionId = await this.resolveXmlIdToActionId('task_management.action_my_tasks');
-            if (actionId) {
-                this.embeddedState.activeSidebarItem = "operations";
-                await this.loadActionById(actionId);
-            } else {
+            this.embeddedState.activeSidebarItem = "operations";
+            if (!(await this.loadActionReference('task_management.action_my_tasks'))) {
                 // Fallback
                 if (this.state.employee?.user_id) {
                     const userId = Array.isArray(this.state.employee.user_id)
@@ -5304,26 +4876,162 @@ export class ZohoDashboard extends Component {
         }
     }
 
-    async loadChartData() {
+    // ==================== SECTION CACHE ====================
+
+    get dashboardCacheKey() {
+        return getDashboardCacheKey();
+    }
+
+    readDashboardCache() {
         try {
-            const leaveData = await this.orm.call("hr.employee", "employee_leave_trend", []);
-            this.state.leaveChartData = leaveData || [];
+            const cache = JSON.parse(browser.localStorage.getItem(this.dashboardCacheKey));
+            return cache && cache.versions && cache.sections ? cache : null;
+        } catch {
+            return null;
+        }
+    }
 
-            const attendanceData = await this.orm.call("hr.employee", "employee_attendance_trend", []);
-            this.state.attendanceChartData = attendanceData || [];
-            
-            // Load activities trend
-            await this.loadActivitiesTrendData();
+    writeDashboardCache(cache) {
+        try {
+            browser.localStorage.setItem(this.dashboardCacheKey, JSON.stringify(cache));
+        } catch (e) {
+            // Storage full or unavailable: the dashboard simply loads uncached next time
+            browser.localStorage.removeItem(this.dashboardCacheKey);
+        }
+    }
 
-            if (this.state.isManager) {
-                const deptData = await this.orm.call("hr.employee", "get_dept_employee", []);
-                this.state.deptChartData = deptData || [];
-            }
+    /**
+     * Send the cached section versions to the server, which only returns the
+     * sections that changed. The merged result is stored back and returned.
+     */
+    async revalidateDashboardSections() {
+        const cache = this.readDashboardCache() || { versions: {}, sections: {} };
+        const result = await this.orm.call("hr.employee", "get_dashboard_sections", [], {
+            versions: cache.versions,
+        });
+        const sections = { ...cache.sections, ...result.sections };
+        this.writeDashboardCache({ versions: result.versions, sections });
+        return sections;
+    }
+
+    applyDashboardSections(sections) {
+        if (sections.employee) {
+            this.applyEmployeeDetails(sections.employee);
+        }
+        if (sections.projects) {
+            this.applyTaskFeed(sections.projects);
+        }
+        if (sections.upcoming) {
+            this.state.birthdays = sections.upcoming.birthday || [];
+            this.state.events = sections.upcoming.event || [];
+            this.state.announcements = sections.upcoming.announcement || [];
+        }
+        if (sections.charts) {
+            this.state.leaveChartData = sections.charts.leave || [];
+            this.state.attendanceChartData = sections.charts.attendance || [];
+            this.state.deptChartData = sections.charts.dept || [];
+        }
+    }
+
+    applyEmployeeDetails(empDetails) {
+        if (empDetails && empDetails[0] && empDetails[0].id) {
+            // Always ensure employee is an object and preserve card counts if already set
+            this.state.employee = Object.assign({
+                payslip_count: 0,
+                emp_timesheets: 0,
+                contracts_count: 0,
+                documents_count: 0,
+                announcements_count: 0,
+            }, this.state.employee?.id === empDetails[0].id ? this.state.employee : {}, empDetails[0]);
+            // Store leave balance summary
+            if (empDetails[0].leave_balance_summary) {
+                this.state.leaveBalanceSummary = empDetails[0].leave_balance_summary;
+            }
+            this.state.attendance = empDetails[0].attendance_lines || [];
+            this.state.leaves = empDetails[0].leave_lines || [];
+            this.state.expenses = empDetails[0].expense_lines || [];
+            this.state.historyCursors = empDetails[0].history_cursors || {};
+            this.state.timesheet_planned_hours = empDetails[0].timesheet_planned_hours || 0;
+            this.state.timesheet_actual_hours = empDetails[0].timesheet_actual_hours || 0;
+        } else {
+            this.state.employee = {
+                id: false,
+                name: 'User',
+                attendance_state: 'checked_out',
+                job_id: false,
+                department_id: false,
+                work_email: '',
+                mobile_phone: '',
+                payslip_count: 0,
+                emp_timesheets: 0,
+                contracts_count: 0,
+                documents_count: 0,
+                announcements_count: 0,
+                broad_factor: 0,
+                leaves_to_approve: 0,
+                leaves_today: 0,
+                leaves_this_month: 0,
+                leaves_alloc_req: 0,
+                job_applications: 0,
+            };
+        }
+    }
+
+    /**
+     * Append the next page of attendance, leave or expense history using the
+     * cursor returned with the previous page.
+     */
+    async loadMoreHistory(recordType) {
+        const cursor = this.state.historyCursors[recordType];
+        if (!cursor) return;
+        const stateKey = { attendance: "attendance", leave: "leaves", expense: "expenses" }[recordType];
+        try {
+            const page = await this.orm.call("hr.employee", "get_history_page", [recordType], {
+                cursor,
+                limit: 20,
+            });
+            this.state[stateKey] = [...this.state[stateKey], ...page.lines];
+            this.state.historyCursors = { ...this.state.historyCursors, [recordType]: page.next_cursor };
         } catch (error) {
-            console.error("Failed to load chart data:", error);
+            console.error("Failed to load history:", error);
+            this.notification.add(_t("Could not load older records"), { type: "warning" });
         }
     }
 
+    applyTaskFeed(feed) {
+        // Caches written before the feed was returned hold a plain task list
+        if (Array.isArray(feed)) {
+            feed = { tasks: feed, stage_counts: [], overdue_count: 0, total: feed.length, next_cursor: false };
+        }
+        this.state.projects = feed.tasks || [];
+        this.state.taskFeed = {
+            stage_counts: feed.stage_counts || [],
+            overdue_count: feed.overdue_count || 0,
+            total: feed.total || 0,
+            next_cursor: feed.next_cursor || false,
+        };
+    }
+
+    async loadMoreTasks() {
+        const cursor = this.state.taskFeed.next_cursor;
+        if (!cursor) return;
+        try {
+            const page = await this.orm.call("hr.employee", "get_employee_task_feed", [], {
+                cursor,
+                limit: 20,
+            });
+            this.state.projects = [...this.state.projects, ...page.tasks];
+            this.state.taskFeed = {
+                stage_counts: page.stage_counts,
+                overdue_count: page.overdue_count,
+                total: page.total,
+                next_cursor: page.next_cursor,
+            };
+        } catch (error) {
+            console.error("Failed to load tasks:", error);
+            this.notification.add(_t("Could not load more tasks"), { type: "warning" });
+        }
+    }
 
     async loadApps() {
         try {
@@ -5712,6 +5420,7 @@ export class ZohoDashboard extends Component {
     }
 
     async onLogout() {
+        clearDashboardCache();
         window.location.href = "/web/session/logout";
     }
 
@@ -5723,7 +5432,8 @@ export class ZohoDashboard extends Component {
         return this.state.currentCompany?.name || "Company";
     }
 
-    renderCharts() {
+    async renderCharts() {
+        await this.loadChartLibrary();
         if (!this.state.chartLoaded || typeof Chart === "undefined") return;
         
         // Use requestAnimationFrame to ensure DOM is ready
@@ -5856,13 +5566,9 @@ export class ZohoDashboard extends Component {
     async openTaskList() {
         // Try to load Task Management module's "My Tasks" view
         try {
-            // First, try to find the action by XML ID
-            const actionId = await this.resolveXmlIdToActionId('task_management.action_my_tasks');
-            
-            if (actionId) {
-                this.embeddedState.activeSidebarItem = "operations";
-                await this.loadActionById(actionId);
-            } else {
+            // First, try to load the action by XML ID
+            this.embeddedState.activeSidebarItem = "operations";
+            if (!(await this.loadActionReference('task_management.action_my_tasks'))) {
                 // Fallback: load task.management model directly
                 if (this.state.employee && this.state.employee.user_id) {
                     const userId = Array.isArray(this.state.employee.user_id)
@@ -5938,12 +5644,12 @@ export class ZohoDashboard extends Component {
         this.state.activitiesTrendPopupOpen = true;
 
         // use setTimeout to allow DOM rendering first
-        setTimeout(() => {
+        this.loadChartLibrary().then(() => setTimeout(() => {
             const canvas = document.querySelector(".popup_chart_container canvas");
-            if (canvas) {
+            if (canvas && this.state.chartLoaded) {
                 this.renderActivitiesTrendChart(canvas);
             }
-        }, 10);
+        }, 10));
     }
 
     closeActivitiesTrendPopup() {
@@ -6153,9 +5859,9 @@ export class ZohoDashboard extends Component {
     openAttendanceTrendPopup() {
         this.state.attendanceTrendPopupOpen = true;
         // Render chart in popup after a short delay to ensure DOM is ready
-        setTimeout(() => {
+        this.loadChartLibrary().then(() => setTimeout(() => {
             this.renderAttendanceChartPopup();
-        }, 100);
+        }, 100));
     }
 
     closeAttendanceTrendPopup() {
@@ -6170,9 +5876,9 @@ export class ZohoDashboard extends Component {
     openLeaveTrendPopup() {
         this.state.leaveTrendPopupOpen = true;
         // Render chart in popup after a short delay to ensure DOM is ready
-        setTimeout(() => {
+        this.loadChartLibrary().then(() => setTimeout(() => {
             this.renderLeaveChartPopup();
-        }, 100);
+        }, 100));
     }
 
     closeLeaveTrendPopup() {
@@ -6338,12 +6044,9 @@ export class ZohoDashboard extends Component {
         this.actionStack = [];
         
         try {
-            // Resolve XML ID to numeric action ID
-            const actionId = await this.resolveXmlIdToActionId(item.actionXmlId);
-            
-            if (actionId) {
-                console.log("📍 Loading sidebar action:", item.actionXmlId, "->", actionId);
-                await this.loadActionById(actionId);
+            // Resolve and load the XML ID in one call
+            if (await this.loadActionReference(item.actionXmlId)) {
+                console.log("📍 Loaded sidebar action:", item.actionXmlId);
             } else {
                 // Fallback to model-based view if action not found
                 console.warn("Could not resolve action XML ID:", item.actionXmlId);
@@ -6393,11 +6096,9 @@ export class ZohoDashboard extends Component {
             const xmlId = knownActions[item.model][actionKey] || knownActions[item.model]['default'];
             
             if (xmlId) {
-                const actionId = await this.resolveXmlIdToActionId(xmlId);
-                if (actionId) {
-                    console.log("📍 Loading known action for model:", item.model, "->", actionId);
-                    this.embeddedState.activeSidebarItem = item.id;
-                    await this.loadActionById(actionId);
+                this.embeddedState.activeSidebarItem = item.id;
+                if (await this.loadActionReference(xmlId)) {
+                    console.log("📍 Loaded known action for model:", item.model, "->", xmlId);
                     return;
                 }
             }
@@ -6410,8 +6111,12 @@ export class ZohoDashboard extends Component {
 
     onTabClick(tabId) {
         this.state.activeTab = tabId;
-        if (tabId === "activities") setTimeout(() => this.renderLeaveChart(), 300);
-        if (tabId === "manager" && this.state.isManager) setTimeout(() => this.renderDeptChart(), 300);
+        if (tabId === "activities") {
+            this.loadChartLibrary().then(() => setTimeout(() => this.renderLeaveChart(), 300));
+        }
+        if (tabId === "manager" && this.state.isManager) {
+            this.loadChartLibrary().then(() => setTimeout(() => this.renderDeptChart(), 300));
+        }
         if (tabId === "employee_applications") {
             this.loadEmployeeApplicationsSummary();
             this.state.employeeApplicationsSummary = [];
@@ -6483,21 +6188,24 @@ export class ZohoDashboard extends Component {
             return;
         }
 
-        if (this.state.employee.attendance_state === 'checked_out' || !this.state.employee.attendance_state) {
-            this.state.employee.attendance_state = 'checked_in';
-        } else {
-            this.state.employee.attendance_state = 'checked_out';
+        if (!this.state.attendanceConfirmed) {
+            // Wait for the server state, the cached one may be stale
+            return;
         }
 
-        await this.updateAttendance();
+        const expectedState = this.state.employee.attendance_state || 'checked_out';
+        this.state.employee.attendance_state = expectedState === 'checked_out' ? 'checked_in' : 'checked_out';
+
+        await this.updateAttendance(expectedState);
     }
 
-    async updateAttendance() {
+    async updateAttendance(expectedState) {
         try {
             const result = await this.orm.call(
                 'hr.employee',
                 'attendance_manual',
-                [[this.state.employee.id]]
+                [[this.state.employee.id]],
+                { expected_state: expectedState }
             );
 
             if (result !== false) {
@@ -6540,10 +6248,8 @@ export class ZohoDashboard extends Component {
         try {
             const empDetails = await this.orm.call("hr.employee", "get_user_employee_details", []);
             if (empDetails?.[0]) {
-                this.state.employee = empDetails[0];
-                this.state.attendance = empDetails[0].attendance_lines || [];
-                this.state.leaves = empDetails[0].leave_lines || [];
-                this.state.expenses = empDetails[0].expense_lines || [];
+                // Replaces the history lines and their cursors together
+                this.applyEmployeeDetails(empDetails);
 
                 if (this.state.employee.attendance_state === "checked_in") {
                     if (!this.state.timerRunning) {
@@ -6888,4 +6594,4 @@ export class ZohoDashboard extends Component {
     }
 }
 
-registry.category("actions").add("hr_dashboard_spa", ZohoDashboard);
\ No newline at end of file
+registry.category("lazy_components").add("hrms_dashboard.ZohoDashboard", ZohoDashboard);
\ No newline at end of file
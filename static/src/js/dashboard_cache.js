@@ -0,0 +1,51 @@
+/** @odoo-module **/
+
+import { browser } from "@web/core/browser/browser";
+import { registry } from "@web/core/registry";
+import { user } from "@web/core/user";
+import { session } from "@web/session";
+import "@web/webclient/user_menu/user_menu_items";
+
+const CACHE_PREFIX = "hrms_dashboard.sections.";
+
+/**
+ * localStorage key of the dashboard section cache. Several databases can
+ * share one origin with the same user ids, so the key holds both.
+ */
+export function getDashboardCacheKey() {
+    return `${CACHE_PREFIX}${session.db}.${user.userId}`;
+}
+
+/**
+ * Remove the cached dashboard sections of every user and database, or of
+ * all but the current session with keepCurrent.
+ */
+export function clearDashboardCache({ keepCurrent = false } = {}) {
+    const currentKey = getDashboardCacheKey();
+    const storage = browser.localStorage;
+    for (let index = storage.length - 1; index >= 0; index--) {
+        const key = storage.key(index);
+        if (key?.startsWith(CACHE_PREFIX) && !(keepCurrent && key === currentKey)) {
+            storage.removeItem(key);
+        }
+    }
+}
+
+// The cache holds personal HR data: drop what other sessions left behind
+clearDashboardCache({ keepCurrent: true });
+
+// ... and clear it on logout from the user menu
+const userMenuItems = registry.category("user_menuitems");
+const logOutItem = userMenuItems.get("log_out", null);
+if (logOutItem) {
+    userMenuItems.add("log_out", (env) => {
+        const item = logOutItem(env);
+        return {
+            ...item,
+            callback: () => {
+                clearDashboardCache();
+                item.callback();
+            },
+        };
+    }, { force: true });
+}
@@ -0,0 +1,20 @@
+/** @odoo-module **/
+
+import { registry } from "@web/core/registry";
+import { Component, xml } from "@odoo/owl";
+import { LazyComponent } from "@web/core/assets";
+
+/**
+ * Lightweight client action kept in web.assets_backend. The dashboard
+ * itself lives in the hrms_dashboard.assets_dashboard bundle, which is only
+ * fetched the first time this action is opened.
+ */
+export class ZohoDashboardLoader extends Component {
+    static template = xml`
+        <LazyComponent bundle="'hrms_dashboard.assets_dashboard'" Component="'hrms_dashboard.ZohoDashboard'" props="props"/>
+    `;
+    static components = { LazyComponent };
+    static props = ["*"];
+}
+
+registry.category("actions").add("hr_dashboard_spa", ZohoDashboardLoader);
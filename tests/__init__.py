@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+from . import test_dashboard_action
+from . import test_dashboard_counter
+from . import test_dashboard_index
+from . import test_dashboard_sections
+from . import test_history_page
+from . import test_presence
+from . import test_res_users
+from . import test_task_feed
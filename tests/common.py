@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import TransactionCase
+
+
+class HrmsDashboardCommon(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = cls._create_user('hrms_dashboard_user', ['base.group_user'])
+        cls.employee = cls.env['hr.employee'].create({
+            'name': 'Dashboard Employee',
+            'user_id': cls.user.id,
+        })
+
+    @classmethod
+    def _create_user(cls, login, groups, **vals):
+        return cls.env['res.users'].create(dict({
+            'name': login,
+            'login': login,
+            'groups_id': [(6, 0, [cls.env.ref(group).id for group in groups])],
+        }, **vals))
+
+    def _read_all_pages(self, fetch, key):
+        """Follow next_cursor until the last page, returning the ids in page order"""
+        ids, cursor, pages = [], None, 0
+        while True:
+            page = fetch(cursor)
+            ids += [line['id'] for line in page[key]]
+            pages += 1
+            cursor = page['next_cursor']
+            if not cursor:
+                return ids, pages
+            self.assertLess(pages, 20, "pagination does not terminate")
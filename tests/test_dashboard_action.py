@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import tagged
+
+from .common import HrmsDashboardCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardAction(HrmsDashboardCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.window_action = cls.env['ir.actions.act_window'].create({
+            'name': 'Dashboard Employees',
+            'res_model': 'hr.employee',
+            'view_mode': 'kanban,list,form',
+        })
+        cls.client_action = cls.env['ir.actions.client'].create({
+            'name': 'Dashboard Client',
+            'tag': 'hrms_dashboard_test_tag',
+        })
+        cls.env['ir.model.data'].create([{
+            'module': 'hrms_dashboard_test',
+            'name': name,
+            'model': action._name,
+            'res_id': action.id,
+        } for name, action in [('window_action', cls.window_action), ('client_action', cls.client_action)]])
+        cls.window_menu = cls.env['ir.ui.menu'].create({
+            'name': 'Dashboard Employees',
+            'action': 'ir.actions.act_window,%d' % cls.window_action.id,
+        })
+        cls.client_menu = cls.env['ir.ui.menu'].create({
+            'name': 'Dashboard Client',
+            'action': 'ir.actions.client,%d' % cls.client_action.id,
+        })
+
+    def _resolve_all(self, action, menu, xml_id):
+        Actions = self.env['ir.actions.actions'].with_user(self.user)
+        return [
+            Actions.get_dashboard_action(action_id=action.id),
+            Actions.get_dashboard_action(menu_id=menu.id),
+            Actions.get_dashboard_action(xml_id=xml_id),
+        ]
+
+    def test_window_action(self):
+        for data in self._resolve_all(self.window_action, self.window_menu, 'hrms_dashboard_test.window_action'):
+            self.assertEqual(data['id'], self.window_action.id)
+            self.assertEqual(data['type'], 'ir.actions.act_window')
+            self.assertEqual(data['res_model'], 'hr.employee')
+            self.assertEqual(data['view_type'], 'kanban')
+            self.assertTrue(data['access']['read'])
+
+    def test_client_action(self):
+        for data in self._resolve_all(self.client_action, self.client_menu, 'hrms_dashboard_test.client_action'):
+            self.assertEqual(data['id'], self.client_action.id)
+            self.assertEqual(data['type'], 'ir.actions.client')
+            self.assertEqual(data['tag'], 'hrms_dashboard_test_tag')
+
+    def test_action_restricted_to_groups(self):
+        self.window_action.groups_id = self.env.ref('base.group_system')
+        Actions = self.env['ir.actions.actions'].with_user(self.user)
+        self.assertFalse(Actions.get_dashboard_action(action_id=self.window_action.id))
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+from odoo.tests import tagged
+
+from .common import HrmsDashboardCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardCounter(HrmsDashboardCommon):
+
+    def _get_counter(self):
+        return self.env['hr.employee.dashboard.counter'].search([('employee_id', '=', self.employee.id)])
+
+    def test_row_created_with_employee(self):
+        counter = self._get_counter()
+        self.assertEqual(len(counter), 1)
+        self.assertEqual(counter.timesheet_count, 0)
+
+    def test_get_counters_does_not_create(self):
+        self._get_counter().unlink()
+        counters = self.env['hr.employee.dashboard.counter']._get_counters(self.employee)
+        self.assertEqual(set(counters.values()), {0})
+        self.assertFalse(self._get_counter())
+
+    def test_analytic_line_hooks(self):
+        project = self.env['project.project'].create({'name': 'Dashboard Project', 'allow_timesheets': True})
+        lines = self.env['account.analytic.line'].create([{
+            'name': 'Work %d' % index,
+            'project_id': project.id,
+            'employee_id': self.employee.id,
+            'unit_amount': 1.0,
+        } for index in range(2)])
+        counter = self._get_counter()
+        self.assertEqual(counter.timesheet_count, 2)
+
+        other = self.env['hr.employee'].create({'name': 'Other Employee'})
+        lines[0].write({'employee_id': other.id})
+        self.assertEqual(counter.timesheet_count, 1)
+        self.assertEqual(self.env['hr.employee.dashboard.counter']._get_counters(other)['timesheet_count'], 1)
+
+        lines[1].unlink()
+        self.assertEqual(counter.timesheet_count, 0)
+
+    def test_optional_source_hooks(self):
+        if 'hr.contract' not in self.env:
+            self.skipTest("hr_contract is not installed")
+        contract = self.env['hr.contract'].create({
+            'name': 'Dashboard Contract',
+            'employee_id': self.employee.id,
+            'wage': 1000.0,
+        })
+        counter = self._get_counter()
+        self.assertEqual(counter.contracts_count, 1)
+
+        contract.unlink()
+        self.assertEqual(counter.contracts_count, 0)
+
+    def test_linking_a_user_refreshes_counters(self):
+        employee = self.env['hr.employee'].create({'name': 'Unlinked Employee'})
+        user = self._create_user('hrms_dashboard_linked', ['base.group_user'])
+        Counter = self.registry['hr.employee.dashboard.counter']
+        with patch.object(Counter, '_refresh_counters', autospec=True) as refresh_counters:
+            employee.write({'user_id': user.id})
+            employee.write({'work_email': 'linked@example.com'})
+        self.assertEqual(refresh_counters.call_count, 1)
+        self.assertEqual(refresh_counters.call_args.args[1], employee)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import tagged
+from odoo.tools import sql
+
+from odoo.addons.hrms_dashboard.models.hrms_dashboard_index import DASHBOARD_INDEXES
+
+from .common import HrmsDashboardCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardIndex(HrmsDashboardCommon):
+
+    def test_indexes_created_and_dropped(self):
+        Index = self.env['hrms.dashboard.index']
+        for _table, indexname, _expressions in DASHBOARD_INDEXES:
+            self.assertTrue(sql.index_exists(self.env.cr, indexname), indexname)
+
+        Index._drop_indexes()
+        for _table, indexname, _expressions in DASHBOARD_INDEXES:
+            self.assertFalse(sql.index_exists(self.env.cr, indexname), indexname)
+
+        Index.init()
+        for _table, indexname, _expressions in DASHBOARD_INDEXES:
+            self.assertTrue(sql.index_exists(self.env.cr, indexname), indexname)
+
+    def test_explain_report(self):
+        report = self.env['hrms.dashboard.index']._explain_dashboard_queries(self.user)
+        names = [line['name'] for line in report]
+        self.assertEqual(names, [
+            'attendance_lines', 'leave_lines', 'expense_lines',
+            'leaves_to_approve', 'leaves_today', 'leaves_this_month', 'allocation_requests',
+            'activities', 'activity_trend',
+            'task_feed', 'task_feed_counts', 'upcoming_birthdays',
+        ])
+        for line in report:
+            self.assertGreaterEqual(line['total_cost'], 0.0)
+            self.assertIsNone(line['actual_time'])
+            self.assertIsInstance(line['seq_scans'], list)
+
+        analyzed = self.env['hrms.dashboard.index']._explain_dashboard_queries(self.user, analyze=True)
+        self.assertTrue(all(line['actual_time'] is not None for line in analyzed))
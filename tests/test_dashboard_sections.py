@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import fields
+from odoo.exceptions import UserError
+from odoo.tests import tagged
+
+from .common import HrmsDashboardCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardSections(HrmsDashboardCommon):
+
+    def test_unchanged_sections_are_skipped(self):
+        Employee = self.env['hr.employee'].with_user(self.user)
+        first = Employee.get_dashboard_sections()
+        self.assertEqual(set(first['sections']), {'employee', 'projects', 'upcoming', 'charts'})
+        self.assertNotIn('image_1920', first['sections']['employee'][0])
+
+        second = Employee.get_dashboard_sections(versions=first['versions'])
+        self.assertEqual(second['versions'], first['versions'])
+        self.assertFalse(second['sections'])
+
+        self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': fields.Datetime.now() - timedelta(hours=1),
+        })
+        third = Employee.get_dashboard_sections(versions=first['versions'])
+        self.assertIn('employee', third['sections'])
+        self.assertNotIn('projects', third['sections'])
+        self.assertEqual(third['sections']['employee'][0]['attendance_state'], 'checked_in')
+
+    def test_attendance_manual_rejects_stale_state(self):
+        Employee = self.env['hr.employee'].with_user(self.user)
+        with self.assertRaises(UserError):
+            Employee.browse().attendance_manual(expected_state='checked_in')
+        self.assertEqual(self.employee.attendance_state, 'checked_out')
+
+        Employee.browse().attendance_manual(expected_state='checked_out')
+        self.assertEqual(self.employee.attendance_state, 'checked_in')
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import HrmsDashboardCommon
+
+
+@tagged('post_install', '-at_install')
+class TestHistoryPage(HrmsDashboardCommon):
+
+    def test_history_pages_with_tied_dates(self):
+        today = fields.Date.today()
+        expenses = self.env['hr.expense'].create([{
+            'name': 'Expense %d' % index,
+            'employee_id': self.employee.id,
+            'total_amount_currency': 10.0,
+            'date': today if index < 5 else today - timedelta(days=1),
+        } for index in range(7)])
+        expected = expenses.sorted(lambda expense: (expense.date, expense.id), reverse=True).ids
+
+        Employee = self.env['hr.employee'].with_user(self.user)
+        ids, pages = self._read_all_pages(
+            lambda cursor: Employee.get_history_page('expense', cursor=cursor, limit=2), 'lines')
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 4)
+
+    def test_history_pages_attendance(self):
+        start = datetime.now().replace(microsecond=0) - timedelta(days=10)
+        attendances = self.env['hr.attendance'].create([{
+            'employee_id': self.employee.id,
+            'check_in': start + timedelta(days=index),
+            'check_out': start + timedelta(days=index, hours=8),
+        } for index in range(3)])
+
+        Employee = self.env['hr.employee'].with_user(self.user)
+        first = Employee.get_history_page('attendance', limit=2)
+        self.assertEqual([line['id'] for line in first['lines']], attendances[::-1][:2].ids)
+        self.assertTrue(first['next_cursor'])
+        last = Employee.get_history_page('attendance', cursor=first['next_cursor'], limit=2)
+        self.assertEqual([line['id'] for line in last['lines']], attendances[:1].ids)
+        self.assertFalse(last['next_cursor'])
+
+    def test_history_limit_is_capped(self):
+        start = datetime.now().replace(microsecond=0) - timedelta(days=10)
+        self.env['hr.attendance'].create([{
+            'employee_id': self.employee.id,
+            'check_in': start + timedelta(days=index),
+            'check_out': start + timedelta(days=index, hours=8),
+        } for index in range(3)])
+        Employee = self.env['hr.employee'].with_user(self.user)
+        with patch('odoo.addons.hrms_dashboard.models.hr_employee.HISTORY_PAGE_MAX_LIMIT', 2):
+            page = Employee.get_history_page('attendance', limit=10000)
+        self.assertEqual(len(page['lines']), 2)
+        self.assertTrue(page['next_cursor'])
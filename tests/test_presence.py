@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import fields
+from odoo.exceptions import AccessError
+from odoo.tests import tagged
+
+from .common import HrmsDashboardCommon
+
+
+@tagged('post_install', '-at_install')
+class TestPresence(HrmsDashboardCommon):
+
+    def _get_snapshot(self):
+        return self.env['hr.employee.presence'].search([('employee_id', '=', self.employee.id)])
+
+    def _get_presence_line(self, user):
+        presence = self.env['hr.employee.presence'].with_user(user).get_presence()
+        return next(line for line in presence['employees'] if line['employee_id'] == self.employee.id)
+
+    def test_snapshot_created_with_employee(self):
+        snapshot = self._get_snapshot()
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot.attendance_state, 'checked_out')
+
+    def test_check_in_and_out(self):
+        check_in = fields.Datetime.now().replace(microsecond=0) - timedelta(hours=2)
+        attendance = self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': check_in,
+        })
+        snapshot = self._get_snapshot()
+        self.assertEqual(snapshot.attendance_state, 'checked_in')
+        self.assertEqual(snapshot.attendance_since, check_in)
+
+        check_out = check_in + timedelta(hours=1)
+        attendance.write({'check_out': check_out})
+        self.assertEqual(snapshot.attendance_state, 'checked_out')
+        self.assertEqual(snapshot.attendance_since, check_out)
+
+        attendance.unlink()
+        self.assertEqual(snapshot.attendance_state, 'checked_out')
+        self.assertFalse(snapshot.attendance_since)
+
+    def test_leave_validation(self):
+        leave_type = self.env['hr.leave.type'].create({
+            'name': 'Dashboard Leave',
+            'requires_allocation': 'no',
+            'leave_validation_type': 'hr',
+        })
+        today = fields.Date.today()
+        leave = self.env['hr.leave'].create({
+            'employee_id': self.employee.id,
+            'holiday_status_id': leave_type.id,
+            'request_date_from': today - timedelta(days=1),
+            'request_date_to': today + timedelta(days=1),
+        })
+        snapshot = self._get_snapshot()
+        self.assertFalse(snapshot.leave_id, "a leave waiting for approval is not a presence")
+
+        leave.action_validate()
+        self.assertEqual(snapshot.leave_id, leave)
+        self.assertEqual(snapshot.leave_type_name, 'Dashboard Leave')
+
+        hr_user = self._create_user('hrms_dashboard_hr', ['base.group_user', 'hr.group_hr_user'])
+        line = self._get_presence_line(hr_user)
+        self.assertTrue(line['on_leave'])
+        self.assertEqual(line['leave_type'], 'Dashboard Leave')
+
+        # Colleagues outside HR only learn that the employee is away
+        colleague = self._create_user('hrms_dashboard_colleague', ['base.group_user'])
+        line = self._get_presence_line(colleague)
+        self.assertTrue(line['on_leave'])
+        self.assertFalse(line['leave_type'])
+
+    def test_expired_leave_rolled_by_cron(self):
+        now = fields.Datetime.now()
+        snapshot = self._get_snapshot()
+        # A leave that ended since the last nightly rebuild
+        snapshot.write({
+            'leave_type_name': 'Ended Leave',
+            'leave_date_from': now - timedelta(days=2),
+            'leave_date_to': now - timedelta(hours=1),
+        })
+        line = self._get_presence_line(self.user)
+        self.assertFalse(line['on_leave'])
+        self.assertTrue(snapshot.leave_date_to, "reading the presence does not write snapshots")
+
+        self.env['hr.employee.presence']._cron_roll_expired_leaves()
+        self.assertFalse(snapshot.leave_date_to)
+        self.assertFalse(snapshot.leave_type_name)
+
+    def test_leave_fields_hidden_from_employees(self):
+        Presence = self.env['hr.employee.presence'].with_user(self.user)
+        self.assertNotIn('leave_type_name', Presence.fields_get())
+        with self.assertRaises(AccessError):
+            Presence.search([]).read(['leave_type_name'])
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestResUsers(TransactionCase):
+
+    def test_assign_in_chunks_to_active_internal_users(self):
+        dashboard_action = self.env.ref('hrms_dashboard.dashboard_action_spa')
+        group_user = self.env.ref('base.group_user')
+        internal_users = self.env['res.users'].create([{
+            'name': 'Internal %d' % index,
+            'login': 'hrms_dashboard_internal_%d' % index,
+            'groups_id': [(6, 0, group_user.ids)],
+        } for index in range(5)])
+        archived_user = self.env['res.users'].create({
+            'name': 'Archived',
+            'login': 'hrms_dashboard_archived',
+            'groups_id': [(6, 0, group_user.ids)],
+        })
+        portal_user = self.env['res.users'].create({
+            'name': 'Portal',
+            'login': 'hrms_dashboard_portal',
+            'groups_id': [(6, 0, self.env.ref('base.group_portal').ids)],
+        })
+        users = internal_users | archived_user | portal_user
+        users.write({'action_id': False})
+        archived_user.active = False
+
+        with patch('odoo.addons.hrms_dashboard.models.res_users.HOME_ACTION_CHUNK_SIZE', 2):
+            updated = self.env['res.users']._assign_dashboard_home_action()
+            self.assertGreaterEqual(updated, len(internal_users))
+            self.assertEqual(internal_users.mapped('action_id'), dashboard_action)
+            self.assertFalse(archived_user.action_id)
+            self.assertFalse(portal_user.action_id)
+
+            # Users already on the dashboard are not touched again
+            self.assertEqual(self.env['res.users']._assign_dashboard_home_action(), 0)
+
+    def test_new_internal_users_get_the_dashboard(self):
+        dashboard_action = self.env.ref('hrms_dashboard.dashboard_action_spa')
+        internal_user, portal_user = self.env['res.users'].create([{
+            'name': 'New Internal',
+            'login': 'hrms_dashboard_new_internal',
+            'groups_id': [(6, 0, self.env.ref('base.group_user').ids)],
+        }, {
+            'name': 'New Portal',
+            'login': 'hrms_dashboard_new_portal',
+            'groups_id': [(6, 0, self.env.ref('base.group_portal').ids)],
+        }])
+        self.assertEqual(internal_user.action_id, dashboard_action)
+        self.assertFalse(portal_user.action_id)
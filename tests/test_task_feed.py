@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import HrmsDashboardCommon
+
+
+@tagged('post_install', '-at_install')
+class TestTaskFeed(HrmsDashboardCommon):
+
+    def test_task_feed_pages_with_tied_deadlines(self):
+        project = self.env['project.project'].create({'name': 'Dashboard Project'})
+        deadline = fields.Datetime.now().replace(microsecond=0) + timedelta(days=3)
+        tasks = self.env['project.task'].create([{
+            'name': 'Task %d' % index,
+            'project_id': project.id,
+            'user_ids': [(6, 0, self.user.ids)],
+            'date_deadline': deadline if index < 3 else False,
+        } for index in range(5)])
+        # Deadlines ascending, tasks without deadline last, ties broken by id
+        expected = tasks.sorted(lambda task: (not task.date_deadline, task.id)).ids
+
+        Employee = self.env['hr.employee'].with_user(self.user)
+        ids, pages = self._read_all_pages(
+            lambda cursor: Employee.get_employee_task_feed(limit=2, cursor=cursor), 'tasks')
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+        feed = Employee.get_employee_task_feed(limit=2)
+        self.assertEqual(feed['total'], 5)
+        self.assertEqual(feed['overdue_count'], 0)
+
+    def test_task_feed_closed_tasks_are_not_overdue(self):
+        project = self.env['project.project'].create({'name': 'Dashboard Project'})
+        self.env['project.task'].create({
+            'name': 'Late but done',
+            'project_id': project.id,
+            'user_ids': [(6, 0, self.user.ids)],
+            'date_deadline': fields.Datetime.now() - timedelta(days=3),
+            'state': '1_done',
+        })
+        feed = self.env['hr.employee'].with_user(self.user).get_employee_task_feed(closed=True)
+        self.assertEqual(feed['total'], 1)
+        self.assertEqual(feed['overdue_count'], 0)
+
+    def test_task_feed_limit_is_capped(self):
+        project = self.env['project.project'].create({'name': 'Dashboard Project'})
+        self.env['project.task'].create([{
+            'name': 'Task %d' % index,
+            'project_id': project.id,
+            'user_ids': [(6, 0, self.user.ids)],
+        } for index in range(3)])
+        Employee = self.env['hr.employee'].with_user(self.user)
+        with patch('odoo.addons.hrms_dashboard.models.hr_employee.HISTORY_PAGE_MAX_LIMIT', 2):
+            feed = Employee.get_employee_task_feed(limit=10000)
+        self.assertEqual(len(feed['tasks']), 2)
+        self.assertTrue(feed['next_cursor'])